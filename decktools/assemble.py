@@ -0,0 +1,131 @@
+"""Assembles the video of the whole deck from the rendered slides.
+
+The partial movie files listed in the manifests are concatenated by stream
+copy, in the order of the slides. Only the stills that are shown at the
+pauses (for `--hold` seconds) are encoded, all animations are copied as they
+are. Loops are played `--loop-repeats` times.
+
+Run from the repository root after rendering:
+
+    python -m decktools.assemble [presentation/Slide1.json ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from decktools.manifest import load_manifest, manifest_paths, steps
+from decktools.video import concatenate, encode_still, last_frame
+
+
+def parse_slide_holds(values):
+    """Parses `SCENE[.NUMBER]=SECONDS` arguments into a dictionary."""
+    slide_holds = dict()
+    for value in values:
+        name, _, seconds = value.partition("=")
+        slide_holds[name] = float(seconds)
+
+    return slide_holds
+
+
+def segments(manifest_path, hold, slide_holds, loop_repeats):
+    """The segments of the slide with the manifest at `manifest_path`, as
+    `(path, duration, frame rate)` triples. A path of None stands for a still
+    of the last frame of the previous segment, which gets its frame rate. The
+    duration is None for animations that keep their own length, the frame
+    rate is None if the manifest does not record it.
+    """
+    manifest = load_manifest(manifest_path)
+    scene_name = os.path.splitext(os.path.basename(manifest_path))[0]
+
+    last_path = frame_rate = None
+    for step in steps(manifest):
+        animations = range(step["start_animation"], step["end_animation"])
+        repeats = loop_repeats if step["type"] == "loop" else 1
+        for _ in range(repeats):
+            for index in animations:
+                data = manifest["animations"][index]
+                last_path = manifest["files"][index]
+                frame_rate = data.get("frame_rate")
+
+                # Holds consist of a single frame, which only needs to be
+                # shown longer.
+                duration = data["duration"] if data.get("hold") else None
+                yield last_path, duration, frame_rate
+
+        if step["type"] == "loop" or last_path is None:
+            continue
+
+        duration = slide_holds.get(
+            "%s.%d" % (scene_name, step["number"]), slide_holds.get(scene_name, hold)
+        )
+        if duration > 0:
+            yield None, duration, frame_rate
+
+
+def assemble(paths, output_path, hold, slide_holds, loop_repeats):
+    """Writes the video of the slides with the manifests at `paths` to
+    `output_path` and returns its duration (in seconds).
+    """
+    input_paths = list()
+    durations = list()
+    with tempfile.TemporaryDirectory() as still_folder:
+        for manifest_path in paths:
+            for path, duration, frame_rate in segments(
+                manifest_path, hold, slide_holds, loop_repeats
+            ):
+                if path is None:
+                    path = os.path.join(still_folder, "%d.mp4" % len(input_paths))
+                    encode_still(
+                        last_frame(input_paths[-1]), path, input_paths[-1], frame_rate
+                    )
+
+                input_paths.append(path)
+                durations.append(duration)
+
+        times = concatenate(input_paths, output_path, durations=durations)
+
+    return float(times[-1][1]) if times else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifests", nargs="*", help="the manifests to assemble")
+    parser.add_argument("--output-folder", default="./presentation")
+    parser.add_argument(
+        "--output", help="the deck video, by default deck.mp4 in the output folder"
+    )
+    parser.add_argument(
+        "--hold",
+        type=float,
+        default=2.0,
+        help="the time (in seconds) the last frame is shown at each pause",
+    )
+    parser.add_argument(
+        "--slide-hold",
+        action="append",
+        default=[],
+        metavar="SCENE[.NUMBER]=SECONDS",
+        help="the hold of all pauses of a scene, or of one of its slides",
+    )
+    parser.add_argument("--loop-repeats", type=int, default=1)
+    args = parser.parse_args()
+
+    output_path = args.output or os.path.join(args.output_folder, "deck.mp4")
+    start = time.perf_counter()
+    duration = assemble(
+        manifest_paths(args.manifests, args.output_folder),
+        output_path,
+        args.hold,
+        parse_slide_holds(args.slide_hold),
+        args.loop_repeats,
+    )
+    print(
+        "%s (%.1fs) assembled in %.2fs"
+        % (output_path, duration, time.perf_counter() - start)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Bounds the disk space used by manim's partial movie cache.
+
+Slides are rendered with an unlimited number of cached partial movie files,
+so the media folder grows with every change. The garbage collection deletes
+the least recently used files until the cache fits into a byte budget, but
+keeps every file that a manifest in the presentation folder refers to, such
+that re-rendering the current slides stays cheap. Rendering a slide marks the
+files it used as recently used.
+
+Run from the repository root:
+
+    python -m decktools.cache gc --budget 10G
+"""
+
+import argparse
+import os
+import re
+
+from decktools.manifest import load_manifest, manifest_paths
+
+# The folders in which manim writes the partial movie files of each scene.
+PARTIAL_MOVIE_FOLDER = "partial_movie_files"
+MOVIE_EXTENSIONS = (".mp4", ".mov", ".webm")
+
+UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(size):
+    """The number of bytes of a size like `500M` or `20G`."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", str(size).upper())
+    if match is None:
+        raise ValueError("Invalid size: %s" % size)
+
+    return int(float(match.group(1)) * UNITS[match.group(2)])
+
+
+def format_size(size):
+    for unit in ("", "K", "M", "G"):
+        if size < 1024:
+            break
+        size /= 1024.0
+
+    return "%.1f%sB" % (size, unit)
+
+
+def cache_key(path):
+    """The hash a partial movie file is named by, which its renditions
+    (`<hash>.<height>p.mp4`) share.
+    """
+    return os.path.basename(path).split(".")[0]
+
+
+def cached_files(media_folder):
+    """The `(path, size, last use)` of each partial movie file (and rendition)
+    in `media_folder`.
+    """
+    files = list()
+    for folder, _, names in os.walk(media_folder):
+        if PARTIAL_MOVIE_FOLDER not in folder.split(os.sep):
+            continue
+
+        for name in names:
+            if not name.endswith(MOVIE_EXTENSIONS):
+                continue
+
+            path = os.path.join(folder, name)
+            status = os.stat(path)
+            files.append((path, status.st_size, status.st_mtime))
+
+    return files
+
+
+def referenced_keys(output_folder):
+    """The cache keys of all files that the manifests in `output_folder`
+    refer to.
+    """
+    keys = set()
+    for path in manifest_paths(None, output_folder):
+        manifest = load_manifest(path)
+        keys.update(cache_key(file) for file in manifest["files"])
+        for data in manifest["animations"]:
+            keys.update(cache_key(file) for file in data.get("renditions", {}).values())
+
+    return keys
+
+
+def touch(paths):
+    """Marks the files at `paths` as used now."""
+    for path in paths:
+        if os.path.exists(path):
+            os.utime(path)
+
+
+def collect(media_folder, budget, output_folder="./presentation", dry_run=False):
+    """Deletes the least recently used partial movie files that no manifest
+    refers to, until the files in `media_folder` take at most `budget` bytes.
+    Returns the deleted files and the remaining size.
+    """
+    files = cached_files(media_folder)
+    size = sum(file_size for _, file_size, _ in files)
+    protected_keys = referenced_keys(output_folder)
+
+    deleted = list()
+    for path, file_size, _ in sorted(files, key=lambda file: file[2]):
+        if size <= budget:
+            break
+        if cache_key(path) in protected_keys:
+            continue
+
+        if not dry_run:
+            os.remove(path)
+        deleted.append(path)
+        size -= file_size
+
+    return deleted, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gc_parser = subparsers.add_parser(
+        "gc", help="delete unused partial movie files until the budget is met"
+    )
+    gc_parser.add_argument(
+        "--budget",
+        default=os.environ.get("PRESENTATION_MEDIA_BUDGET", "10G"),
+        help="the maximum size of the cache, e.g., 500M or 20G",
+    )
+    gc_parser.add_argument("--media-folder", default="./media")
+    gc_parser.add_argument("--output-folder", default="./presentation")
+    gc_parser.add_argument(
+        "--dry-run", action="store_true", help="only list the files to delete"
+    )
+    args = parser.parse_args()
+
+    deleted, size = collect(
+        args.media_folder,
+        parse_size(args.budget),
+        args.output_folder,
+        dry_run=args.dry_run,
+    )
+    for path in deleted:
+        print(("would delete %s" if args.dry_run else "deleted %s") % path)
+    print("%d files deleted, %s cached" % (len(deleted), format_size(size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Combines the partial movie files of each rendered slide into one file.
+
+The partial movie files are concatenated by stream copy into a fragmented
+`files/<Scene>/<Scene>.mp4`. Every animation starts with a keyframe and
+thus a fragment. The manifest is extended by the `movie` and, for each
+animation, its `start` and `end` time (in seconds) and the `byte_offset` of
+its first fragment, such that players can seek to any step in a single
+file.
+
+Run from the repository root after rendering:
+
+    python -m decktools.consolidate [presentation/Slide1.json ...]
+"""
+
+import argparse
+import json
+import os
+
+from decktools.manifest import load_manifest, manifest_paths
+from decktools.video import FRAGMENTED_MP4_OPTIONS, concatenate, fragments
+
+
+def consolidate(manifest_path):
+    manifest = load_manifest(manifest_path)
+    if not manifest["files"]:
+        return manifest
+
+    scene_name = os.path.splitext(os.path.basename(manifest_path))[0]
+    movie = os.path.join(os.path.dirname(manifest["files"][0]), scene_name + ".mp4")
+    times = concatenate(manifest["files"], movie, FRAGMENTED_MP4_OPTIONS)
+
+    # Negative decode times are not possible in fragmented MP4 files, so the
+    # muxer delays all times by the decoding delay of the first frames.
+    movie_fragments = fragments(movie)
+    delay = movie_fragments[0][0] - times[0][2]
+    for data, (start, end, decode_start) in zip(manifest["animations"], times):
+        # Each animation starts with a keyframe and thus a fragment.
+        _, byte_offset = min(
+            movie_fragments,
+            key=lambda fragment: abs(fragment[0] - delay - decode_start),
+        )
+        data.update(
+            start=float(start + delay),
+            end=float(end + delay),
+            byte_offset=byte_offset,
+        )
+
+    manifest["movie"] = movie
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifests", nargs="*", help="the manifests to consolidate")
+    parser.add_argument("--output-folder", default="./presentation")
+    args = parser.parse_args()
+
+    for path in manifest_paths(args.manifests, args.output_folder):
+        manifest = consolidate(path)
+        print("%s: %d files consolidated" % (path, len(manifest["files"])))
+
+
+if __name__ == "__main__":
+    main()
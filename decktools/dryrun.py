@@ -0,0 +1,64 @@
+"""Checks the structure of the slides without rendering them.
+
+Every slide is executed with a renderer that neither rasterizes nor encodes
+frames. The animations and pauses are still counted, the loop nesting is
+validated and the manifest (with estimated durations) is written to
+`presentation/dry-run/<Scene>.json`.
+
+Run from the repository root:
+
+    python -m decktools.dryrun [slide1.py slide2.py ...]
+"""
+
+import argparse
+import sys
+import time
+
+from manim import tempconfig
+
+from decktools.slides import import_slide, slide_classes, slide_paths
+
+
+def dry_run(slide_class, output_folder):
+    """Executes `slide_class` in a dry run and returns the scene."""
+    with tempconfig({"dry_run": True, "verbosity": "WARNING"}):
+        scene = slide_class(output_folder=output_folder)
+        scene.render()
+
+    return scene
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("slides", nargs="*", help="the slide files to check")
+    parser.add_argument("--output-folder", default="./presentation")
+    args = parser.parse_args()
+
+    failed = 0
+    for path in slide_paths(args.slides):
+        for slide_class in slide_classes(import_slide(path)):
+            start = time.perf_counter()
+            try:
+                scene = dry_run(slide_class, args.output_folder)
+            except AssertionError as error:
+                failed += 1
+                print("%s: %s" % (slide_class.__name__, error))
+                continue
+
+            duration = sum(data["duration"] for data in scene.animation_data)
+            print(
+                "%s: %d animations, %d slides, ~%.1fs (checked in %.2fs)"
+                % (
+                    slide_class.__name__,
+                    scene.current_animation,
+                    len(scene.slides),
+                    duration,
+                    time.perf_counter() - start,
+                )
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""Renders the slides on several machines that share a queue folder.
+
+Each slide class is a job, which is a file in `<queue>/pending`. Workers
+claim a job by renaming it to `<queue>/claimed` (which only one of them can
+do), keep its modification time current while they render it and write the
+rendered slide (its manifest and files) to `<queue>/results`. The
+coordinator copies the results into the presentation folder and moves jobs
+whose worker stopped updating them back to `pending`.
+
+Run from the repository root, e.g., with a queue on a shared mount:
+
+    python -m decktools.farm submit --queue /mnt/queue [slide1.py ...]
+    python -m decktools.farm worker --queue /mnt/queue  # on every machine
+    python -m decktools.farm coordinate --queue /mnt/queue
+
+or, to start several workers on this machine:
+
+    python -m decktools.farm local --workers 4 [slide1.py ...]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+import traceback
+
+from decktools.slides import ROOT, import_slide, slide_classes, slide_paths
+
+STATES = ("pending", "claimed", "done", "failed")
+
+# The time (in seconds) between two updates of a claimed job by its worker,
+# and the time after which a claimed job without updates is requeued.
+HEARTBEAT_INTERVAL = 10.0
+STALL_TIMEOUT = 60.0
+
+# The number of times a job is claimed before it is considered failed.
+MAX_ATTEMPTS = 3
+
+# The time (in seconds) between two polls of the queue.
+POLL_INTERVAL = 1.0
+
+
+class Queue:
+    def __init__(self, folder):
+        self.folder = folder
+        for state in STATES + ("results",):
+            os.makedirs(os.path.join(folder, state), exist_ok=True)
+
+    def path(self, state, job_id):
+        return os.path.join(self.folder, state, job_id + ".json")
+
+    def result_name(self, job_id):
+        # A job that was requeued may be rendered by two workers at the same
+        # time, so each of them renders into its own folder.
+        return "%s-%s-%d" % (job_id, socket.gethostname(), os.getpid())
+
+    def result_folder(self, name):
+        # Machines may mount the queue at different paths, so jobs only hold
+        # the name of their result folder.
+        return os.path.join(self.folder, "results", name)
+
+    def jobs(self, state):
+        names = sorted(os.listdir(os.path.join(self.folder, state)))
+        return [name[: -len(".json")] for name in names if name.endswith(".json")]
+
+    def read(self, state, job_id):
+        with open(self.path(state, job_id)) as f:
+            return json.load(f)
+
+    def write(self, state, job):
+        # Jobs are written to a temporary file and renamed, such that no one
+        # reads a partially written job.
+        path = self.path(state, job["id"])
+        temporary_path = "%s.%s-%d.tmp" % (path, socket.gethostname(), os.getpid())
+        with open(temporary_path, "w") as f:
+            json.dump(job, f)
+        os.replace(temporary_path, path)
+
+    def submit(self, slide_path, scene, quality):
+        job = dict(
+            id=scene,
+            slide=os.path.relpath(os.path.abspath(slide_path), ROOT),
+            scene=scene,
+            quality=quality,
+            attempts=0,
+        )
+        for state in STATES:
+            if os.path.exists(self.path(state, scene)):
+                os.remove(self.path(state, scene))
+        for name in os.listdir(os.path.join(self.folder, "results")):
+            if name.startswith(scene + "-"):
+                shutil.rmtree(os.path.join(self.folder, "results", name))
+        self.write("pending", job)
+
+    def claim(self):
+        """Claims the next pending job and returns it, or None if there is
+        none.
+        """
+        for job_id in self.jobs("pending"):
+            # Renaming keeps the modification time, which is the time of the
+            # last heartbeat. It is updated before, such that the coordinator
+            # never sees the claimed job with the time it was submitted at.
+            try:
+                os.utime(self.path("pending", job_id))
+                os.rename(self.path("pending", job_id), self.path("claimed", job_id))
+            except FileNotFoundError:
+                # Another worker was faster.
+                continue
+
+            return self.read("claimed", job_id)
+
+        return None
+
+    def finish(self, job, state):
+        """Moves the claimed `job` to `state` (done or failed)."""
+        try:
+            self.write(state, job)
+            os.remove(self.path("claimed", job["id"]))
+        except FileNotFoundError:
+            # The job was requeued in the meantime, but it is finished now.
+            for other_state in ("pending", "claimed"):
+                if os.path.exists(self.path(other_state, job["id"])):
+                    os.remove(self.path(other_state, job["id"]))
+
+    def requeue_stalled(self):
+        """Moves claimed jobs whose worker stopped updating them back to
+        pending, or to failed after `MAX_ATTEMPTS` claims. Returns their ids.
+        """
+        stalled = list()
+        for job_id in self.jobs("claimed"):
+            try:
+                updated = os.path.getmtime(self.path("claimed", job_id))
+                if time.time() - updated < STALL_TIMEOUT:
+                    continue
+                job = self.read("claimed", job_id)
+            except FileNotFoundError:
+                continue
+
+            job["attempts"] += 1
+            if job["attempts"] >= MAX_ATTEMPTS:
+                job["error"] = "The worker stopped responding"
+                self.write("failed", job)
+            else:
+                self.write("pending", job)
+            os.remove(self.path("claimed", job_id))
+            stalled.append(job_id)
+
+        return stalled
+
+
+class Heartbeat(threading.Thread):
+    """Updates the modification time of a claimed job while it renders."""
+
+    def __init__(self, path):
+        super().__init__(daemon=True)
+        self.path = path
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(HEARTBEAT_INTERVAL):
+            try:
+                os.utime(self.path)
+            except FileNotFoundError:
+                return
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def render(job, result_folder):
+    """Renders the slide of `job` into `result_folder`."""
+    from manim import tempconfig
+
+    path = os.path.join(ROOT, job["slide"])
+    module = import_slide(path)
+    slide_class = getattr(module, job["scene"])
+
+    shutil.rmtree(result_folder, ignore_errors=True)
+    with tempconfig({"quality": job["quality"], "preview": False, "input_file": path}):
+        slide_class(output_folder=result_folder).render()
+
+
+def work(queue, wait=False):
+    """Renders jobs until the queue is empty (or forever, with `wait`)."""
+    while True:
+        job = queue.claim()
+        if job is None:
+            if not wait:
+                return
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        print("Rendering %s" % job["scene"])
+        start = time.perf_counter()
+        heartbeat = Heartbeat(queue.path("claimed", job["id"]))
+        heartbeat.start()
+        job["result"] = queue.result_name(job["id"])
+        result_folder = queue.result_folder(job["result"])
+
+        # The paths in the manifests are those of this worker.
+        job["rendered_folder"] = result_folder
+        try:
+            render(job, result_folder)
+        except Exception:
+            job["error"] = traceback.format_exc()
+            print(job["error"], file=sys.stderr)
+            queue.finish(job, "failed")
+        else:
+            queue.finish(job, "done")
+            print("%s rendered in %.2fs" % (job["scene"], time.perf_counter() - start))
+        finally:
+            heartbeat.stop()
+
+
+def relocate_manifests(src_folder, dst_folder, rendered_folder=None):
+    """Writes the manifests in `src_folder` to `dst_folder`, with their paths
+    pointing to the same files in `dst_folder`. The paths in the manifests
+    start with `rendered_folder`, the path of `src_folder` when the slides
+    were rendered (by default `src_folder` itself).
+    """
+    if rendered_folder is None:
+        rendered_folder = src_folder
+
+    def relocate(path):
+        if path is None:
+            return None
+        return os.path.join(dst_folder, os.path.relpath(path, rendered_folder))
+
+    os.makedirs(dst_folder, exist_ok=True)
+    for name in os.listdir(src_folder):
+        if not name.endswith(".json"):
+            continue
+
+        with open(os.path.join(src_folder, name)) as f:
+            manifest = json.load(f)
+
+        manifest["files"] = [relocate(file) for file in manifest["files"]]
+        manifest["sprite_sheet"] = relocate(manifest.get("sprite_sheet"))
+        for slide in manifest["slides"]:
+            if "thumbnail" in slide:
+                slide["thumbnail"] = relocate(slide["thumbnail"])
+        for data in manifest.get("animations", []):
+            for rendition, path in data.get("renditions", {}).items():
+                data["renditions"][rendition] = relocate(path)
+
+        with open(os.path.join(dst_folder, name), "w") as f:
+            json.dump(manifest, f)
+
+
+def merge(result_folder, output_folder, rendered_folder=None):
+    """Copies the manifests and files of the rendered slides in
+    `result_folder` to `output_folder`, see `relocate_manifests`.
+    """
+    files_folder = os.path.join(result_folder, "files")
+    for scene_name in os.listdir(files_folder):
+        dst_folder = os.path.join(output_folder, "files", scene_name)
+        shutil.rmtree(dst_folder, ignore_errors=True)
+        shutil.copytree(os.path.join(files_folder, scene_name), dst_folder)
+
+    relocate_manifests(result_folder, output_folder, rendered_folder)
+
+
+def coordinate(queue, output_folder):
+    """Merges the results of finished jobs into `output_folder` and requeues
+    stalled jobs until no job is pending or claimed. Returns the failed jobs.
+    """
+    merged = set()
+    while True:
+        for job_id in queue.requeue_stalled():
+            print("Requeued %s" % job_id)
+
+        # Checked before merging, such that jobs finishing in between are
+        # still merged.
+        active = queue.jobs("pending") or queue.jobs("claimed")
+
+        for job_id in queue.jobs("done"):
+            if job_id not in merged:
+                job = queue.read("done", job_id)
+                merge(
+                    queue.result_folder(job["result"]),
+                    output_folder,
+                    job["rendered_folder"],
+                )
+                merged.add(job_id)
+                print("Merged %s" % job_id)
+
+        if not active:
+            break
+        time.sleep(POLL_INTERVAL)
+
+    failed = [queue.read("failed", job_id) for job_id in queue.jobs("failed")]
+    for job in failed:
+        print("%s failed:\n%s" % (job["scene"], job.get("error", "")))
+    return failed
+
+
+def submit(queue, paths, quality):
+    for path in slide_paths(paths):
+        for slide_class in slide_classes(import_slide(path)):
+            queue.submit(path, slide_class.__name__, quality)
+            print("Submitted %s" % slide_class.__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = subparsers.add_parser("submit", help="queue slides")
+    worker_parser = subparsers.add_parser("worker", help="render queued slides")
+    coordinate_parser = subparsers.add_parser(
+        "coordinate", help="collect the rendered slides"
+    )
+    local_parser = subparsers.add_parser(
+        "local", help="queue slides and render them with local workers"
+    )
+    for subparser in (submit_parser, worker_parser, coordinate_parser, local_parser):
+        subparser.add_argument("--queue", default="./render-queue")
+    for subparser in (submit_parser, local_parser):
+        subparser.add_argument("slides", nargs="*", help="the slide files to queue")
+        subparser.add_argument("--quality", default="low_quality")
+    for subparser in (coordinate_parser, local_parser):
+        subparser.add_argument("--output-folder", default="./presentation")
+    worker_parser.add_argument(
+        "--wait", action="store_true", help="wait for jobs when the queue is empty"
+    )
+    local_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    queue = Queue(args.queue)
+    if args.command == "submit":
+        submit(queue, args.slides, args.quality)
+    elif args.command == "worker":
+        work(queue, wait=args.wait)
+    elif args.command == "coordinate":
+        sys.exit(1 if coordinate(queue, args.output_folder) else 0)
+    else:
+        submit(queue, args.slides, args.quality)
+
+        # The workers wait for jobs, such that requeued jobs are rendered even
+        # after the queue was empty, and are stopped once all jobs finished.
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "decktools.farm", "worker"]
+                + ["--queue", args.queue, "--wait"]
+            )
+            for _ in range(args.workers)
+        ]
+        try:
+            failed = coordinate(queue, args.output_folder)
+        finally:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.wait()
+        sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import glob
+import json
+import os
+
+from decktools.slides import slide_number
+
+
+def manifest_paths(paths=None, output_folder="./presentation"):
+    """The given manifests, or all `<Scene>.json` manifests in the
+    `output_folder`, ordered by the number of their slide.
+    """
+    if not paths:
+        paths = glob.glob(os.path.join(output_folder, "*.json"))
+
+    return sorted(paths, key=slide_number)
+
+
+def load_manifest(path):
+    with open(path) as f:
+        manifest = json.load(f)
+
+    # Manifests written before the animation data was recorded only list the
+    # files.
+    manifest.setdefault("animations", [dict() for _ in manifest["files"]])
+    return manifest
+
+
+def steps(manifest):
+    """The steps of a manifest, i.e., its slides and loops, followed by one
+    more slide holding the animations after the last pause (if there are
+    any).
+    """
+    steps = [dict(slide) for slide in manifest["slides"]]
+    last_animation = steps[-1]["end_animation"] if steps else 0
+    if last_animation < len(manifest["files"]):
+        steps.append(
+            dict(
+                type="slide",
+                start_animation=last_animation,
+                end_animation=len(manifest["files"]),
+                number=len(steps) + 1,
+            )
+        )
+
+    return steps
@@ -0,0 +1,287 @@
+"""Presents rendered slides from their manifests.
+
+The segments of the upcoming steps are decoded in a background thread while
+the current step plays, so advancing to the next step does not have to wait
+for the disk or the decoder. Loops are repeated until the next step is
+requested and every slide holds its last frame until then.
+
+Slides consolidated by `decktools.consolidate` are read from their single
+movie file, seeking to the start of each step.
+
+Keys: right, space or page down advance, left or page up go back, f toggles
+fullscreen, q or escape quit.
+
+Run from the repository root:
+
+    python -m decktools.player [presentation/Slide1.json ...]
+"""
+
+import argparse
+import collections
+import threading
+
+import av
+import numpy as np
+import pyglet
+from pyglet.window import key
+
+from decktools.manifest import load_manifest, manifest_paths, steps
+
+# The number of decoded frames kept per step.
+BUFFER_SIZE = 60
+
+# The number of steps after the current one that are decoded ahead.
+LOOKAHEAD = 2
+
+# The precision (in seconds) of the animation times in consolidated movies.
+TIME_TOLERANCE = 1e-6
+
+
+def frame_image(frame):
+    """A decoded frame as `(width, height, pixels)`, with the pixels as rows
+    of RGB bytes (bottom row first, as pyglet expects).
+    """
+    pixels = np.flipud(frame.to_ndarray(format="rgb24"))
+    return frame.width, frame.height, pixels.tobytes()
+
+
+def animation_frames(container, data, consolidated=False):
+    """Decodes the frames of one animation from `container`, which is either
+    its partial movie file or the `consolidated` movie of the slide. Yields
+    `(image, duration)` pairs.
+    """
+    stream = container.streams.video[0]
+    frame_rate = data.get("frame_rate") or float(stream.average_rate)
+
+    # In a consolidated movie, the animation is found by seeking to its
+    # start, which is a keyframe.
+    if consolidated:
+        container.seek(round(data["start"] / stream.time_base), stream=stream)
+
+    for frame in container.decode(stream):
+        if consolidated:
+            time = frame.pts * stream.time_base
+            if time < data["start"] - TIME_TOLERANCE:
+                continue
+            if time >= data["end"] - TIME_TOLERANCE:
+                break
+
+        # A hold consists of a single frame that is shown for the duration of
+        # the wait.
+        if data.get("hold"):
+            yield frame_image(frame), data["duration"]
+            break
+
+        yield frame_image(frame), 1.0 / frame_rate
+
+
+def step_frames(manifest, step):
+    """Decodes the frames of a step. Yields `(image, duration)` pairs with
+    the image as `(width, height, pixels)` and the time it is shown.
+    """
+    indices = range(step["start_animation"], step["end_animation"])
+    if "movie" in manifest:
+        # A consolidated slide is read from a single file.
+        with av.open(manifest["movie"]) as container:
+            for index in indices:
+                data = manifest["animations"][index]
+                yield from animation_frames(container, data, consolidated=True)
+        return
+
+    for index in indices:
+        with av.open(manifest["files"][index]) as container:
+            yield from animation_frames(container, manifest["animations"][index])
+
+
+class StepBuffer:
+    """The decoded frames of one step, filled by the decoder and consumed by
+    the player.
+    """
+
+    def __init__(self, manifest, step):
+        self.manifest = manifest
+        self.step = step
+        self.frames = collections.deque()
+        self.iterator = step_frames(manifest, step)
+        self.exhausted = False
+
+        # Whether the iterator has yielded a frame since it was started.
+        self.started = False
+
+    def is_full(self):
+        return self.exhausted or len(self.frames) >= BUFFER_SIZE
+
+    def decode_next(self):
+        try:
+            self.frames.append(next(self.iterator))
+            self.started = True
+        except StopIteration:
+            if self.step["type"] == "loop" and self.started:
+                # Loops start over, such that their first frames directly
+                # follow the last ones. Loops without frames (e.g., without
+                # animations) would start over forever, so they end.
+                self.iterator = step_frames(self.manifest, self.step)
+                self.started = False
+            else:
+                self.exhausted = True
+
+
+class Decoder(threading.Thread):
+    """Decodes the frames of the current step and of the `LOOKAHEAD`
+    following steps.
+    """
+
+    def __init__(self, steps):
+        super().__init__(daemon=True)
+        self.steps = steps
+        self.buffers = dict()
+        self.current = 0
+        self.condition = threading.Condition()
+        self.running = True
+
+    def set_current(self, current):
+        with self.condition:
+            # Going back starts the step from the beginning. The steps up to
+            # the previous one have been played as well, so their buffers are
+            # drained and have to be decoded again.
+            if current < self.current:
+                for index in list(self.buffers):
+                    if index >= current:
+                        del self.buffers[index]
+
+            self.current = current
+            for index in list(self.buffers):
+                if index < current or index > current + LOOKAHEAD:
+                    del self.buffers[index]
+            self.condition.notify()
+
+    def buffer(self, index):
+        with self.condition:
+            if index not in self.buffers:
+                self.buffers[index] = StepBuffer(*self.steps[index])
+            return self.buffers[index]
+
+    def pop(self, index):
+        """The next frame of step `index`, or None if it is not decoded yet."""
+        with self.condition:
+            buffer = self.buffers.get(index)
+            if buffer is None or not buffer.frames:
+                return None
+
+            self.condition.notify()
+            return buffer.frames.popleft()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def next_buffer(self):
+        """The buffer with the highest priority that is not full."""
+        end = min(self.current + LOOKAHEAD + 1, len(self.steps))
+        for index in range(self.current, end):
+            buffer = self.buffer(index)
+            if not buffer.is_full():
+                return buffer
+
+        return None
+
+    def run(self):
+        while True:
+            with self.condition:
+                buffer = self.next_buffer()
+                while self.running and buffer is None:
+                    self.condition.wait()
+                    buffer = self.next_buffer()
+
+                if not self.running:
+                    return
+
+            # Decoding happens outside of the lock, such that the player is
+            # never blocked by it.
+            buffer.decode_next()
+
+
+class Player(pyglet.window.Window):
+    def __init__(self, steps, **kwargs):
+        super().__init__(caption="Presentation", resizable=True, **kwargs)
+        self.steps = steps
+        self.decoder = Decoder(steps)
+        self.decoder.start()
+
+        self.current = 0
+        self.texture = None
+        self.remaining_time = 0.0
+        pyglet.clock.schedule(self.update)
+
+    def go_to(self, index):
+        if not 0 <= index < len(self.steps):
+            return
+
+        self.current = index
+        self.remaining_time = 0.0
+        self.decoder.set_current(index)
+
+    def update(self, dt):
+        # Show the frames that are due. If the next frame is not decoded yet
+        # or the step is over, the last frame simply stays on screen.
+        self.remaining_time -= dt
+        while self.remaining_time <= 0.0:
+            frame = self.decoder.pop(self.current)
+            if frame is None:
+                self.remaining_time = 0.0
+                break
+
+            (width, height, pixels), duration = frame
+            image = pyglet.image.ImageData(width, height, "RGB", pixels)
+            self.texture = image.get_texture()
+            self.remaining_time += duration
+
+    def on_draw(self):
+        self.clear()
+        if self.texture is None:
+            return
+
+        # Fit the frame into the window, keeping its aspect ratio.
+        scale = min(self.width / self.texture.width, self.height / self.texture.height)
+        width, height = self.texture.width * scale, self.texture.height * scale
+        self.texture.blit(
+            (self.width - width) / 2,
+            (self.height - height) / 2,
+            width=width,
+            height=height,
+        )
+
+    def on_key_press(self, symbol, modifiers):
+        if symbol in (key.RIGHT, key.SPACE, key.PAGEDOWN):
+            self.go_to(self.current + 1)
+        elif symbol in (key.LEFT, key.PAGEUP):
+            self.go_to(self.current - 1)
+        elif symbol == key.F:
+            self.set_fullscreen(not self.fullscreen)
+        elif symbol in (key.Q, key.ESCAPE):
+            self.close()
+
+    def on_close(self):
+        self.decoder.stop()
+        super().on_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifests", nargs="*", help="the manifests to present")
+    parser.add_argument("--output-folder", default="./presentation")
+    parser.add_argument("--fullscreen", action="store_true")
+    args = parser.parse_args()
+
+    deck = list()
+    for path in manifest_paths(args.manifests, args.output_folder):
+        manifest = load_manifest(path)
+        deck.extend((manifest, step) for step in steps(manifest))
+
+    Player(deck, fullscreen=args.fullscreen)
+    pyglet.app.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import glob
+import importlib
+import inspect
+import os
+import re
+import sys
+
+# The repository root, which contains the `slide*.py` files.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Data files that slides may load.
+DATA_EXTENSIONS = (".txt", ".hyp", ".json", ".png", ".svg")
+
+
+def slide_number(path):
+    """The number in the file name of a slide, such that `slide10.py` is
+    sorted after `slide9.py`.
+    """
+    match = re.search(r"(\d+)", os.path.basename(path))
+    return int(match.group(1)) if match else 0
+
+
+def slide_paths(paths=None):
+    """The given slide files, or all `slide*.py` files of the repository,
+    ordered by their number.
+    """
+    if not paths:
+        paths = glob.glob(os.path.join(ROOT, "slide*.py"))
+
+    return sorted(paths, key=slide_number)
+
+
+def slide_classes(module):
+    """All :class:`PresentationSlide` subclasses defined in `module`."""
+    # Imported here, such that tools working only with the rendered output
+    # (e.g., the player) do not require manim. The class is looked up on each
+    # call, since the template may have been reloaded.
+    import manim_presentation_template
+
+    presentation_slide = manim_presentation_template.PresentationSlide
+    return [
+        cls
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, presentation_slide) and cls.__module__ == module.__name__
+    ]
+
+
+def import_slide(path, reload=False):
+    """Imports (or re-imports) the module defined in the slide file at
+    `path` and returns it.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    if reload and name in sys.modules:
+        return importlib.reload(sys.modules[name])
+
+    return importlib.import_module(name)
+
+
+def local_module_paths():
+    """The source files of the imported modules of the repository (e.g.,
+    the template, `vertexcover` and `mextensions`), except for the slides.
+    """
+    slides = {os.path.abspath(path) for path in slide_paths()}
+    paths = set()
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path is None or not path.endswith(".py"):
+            continue
+
+        path = os.path.abspath(path)
+        if (
+            path.startswith(ROOT + os.sep)
+            and "site-packages" not in path
+            and path not in slides
+        ):
+            paths.add(path)
+
+    return sorted(paths)
+
+
+def mentioned_data_files(paths):
+    """The data files of the repository (see `DATA_EXTENSIONS`) whose paths
+    are mentioned as string literals in the files at `paths`, such as
+    `"hrg-large.txt"` in a slide that loads it.
+    """
+    pattern = re.compile(
+        r"[\"']([\w./-]+(?:%s))[\"']"
+        % "|".join(re.escape(extension) for extension in DATA_EXTENSIONS)
+    )
+    data_files = set()
+    for path in paths:
+        with open(path) as f:
+            for name in pattern.findall(f.read()):
+                data_path = os.path.join(ROOT, name)
+                if os.path.isfile(data_path):
+                    data_files.add(data_path)
+
+    return sorted(data_files)
@@ -0,0 +1,195 @@
+import struct
+from fractions import Fraction
+
+import av
+
+# Fragments the MP4 at every keyframe, such that each animation starts a
+# fragment (its first frame is always a keyframe), and writes the time of
+# each fragment into it.
+FRAGMENTED_MP4_OPTIONS = {"movflags": "frag_keyframe+empty_moov+default_base_moof"}
+
+
+def concatenate(input_paths, output_path, options=None, durations=None):
+    """Concatenates the video streams of the files at `input_paths` into
+    `output_path` by stream copy, i.e., without re-encoding. All inputs need
+    to use the same codec parameters, as the partial movie files of manim do.
+
+    An input with a `durations` entry other than None is extended to that
+    duration (in seconds) by showing its last frame longer, which is meant
+    for stills.
+
+    Returns the `(start, end, decode start)` times (in seconds) of each input
+    in the output. The decode start precedes the start if the first frames
+    are decoded before they are shown (i.e., with B-frames).
+    """
+    output = av.open(output_path, mode="w", options=options or dict())
+    output_stream = None
+    offset = Fraction(0)
+    last_dts = None
+    times = list()
+
+    if durations is None:
+        durations = [None] * len(input_paths)
+
+    for input_path, input_duration in zip(input_paths, durations):
+        with av.open(input_path) as container:
+            stream = container.streams.video[0]
+            if output_stream is None:
+                output_stream = output.add_stream(template=stream)
+
+            packets = [
+                packet for packet in container.demux(stream) if packet.dts is not None
+            ]
+            if not packets:
+                times.append((offset, offset, offset))
+                continue
+
+            # The packets are shifted such that the input starts at `offset`.
+            # They keep the time base of the input, muxing rebases them.
+            start = min(packet.pts for packet in packets)
+            end = max(packet.pts + packet.duration for packet in packets)
+            if input_duration is not None:
+                last_packet = max(packets, key=lambda packet: packet.pts)
+                extended_end = start + round(input_duration / stream.time_base)
+                last_packet.duration += max(extended_end - end, 0)
+                end = max(extended_end, end)
+
+            shift = round(offset / stream.time_base) - start
+            decode_start = None
+            for packet in packets:
+                packet.pts += shift
+                packet.dts += shift
+
+                # Inputs with B-frames start decoding before their first
+                # frame is shown, which may overlap with the end of the
+                # previous input. Decode times have to increase strictly.
+                dts = packet.dts * stream.time_base
+                if last_dts is not None and dts <= last_dts:
+                    packet.dts = int(last_dts / stream.time_base) + 1
+                    dts = packet.dts * stream.time_base
+                last_dts = dts
+                if decode_start is None:
+                    decode_start = dts
+
+                packet.stream = output_stream
+                output.mux(packet)
+
+            duration = (end - start) * stream.time_base
+            times.append((offset, offset + duration, decode_start))
+            offset += duration
+
+    output.close()
+    return times
+
+
+def last_frame(path):
+    """The last frame of the video stream of the file at `path`."""
+    frame = None
+    with av.open(path) as container:
+        for frame in container.decode(video=0):
+            pass
+
+    return frame
+
+
+def av_frame_rate(frame_rate):
+    """The exact frame rate for `frame_rate` that manim encodes with, i.e.,
+    an integer or an NTSC rate such as 30000/1001 for 29.97.
+    """
+    frame_rate = Fraction(frame_rate)
+    if abs(frame_rate - round(frame_rate)) < 1e-4:
+        return Fraction(round(frame_rate))
+    return Fraction(round(frame_rate * 1001 / 1000) * 1000, 1001)
+
+
+def encode_still(frame, output_path, template_path, frame_rate=None):
+    """Encodes `frame` as a single-frame video at `output_path`, with the
+    codec parameters of the file at `template_path` (as written by manim),
+    such that it can be concatenated with that file by stream copy.
+
+    The `frame_rate` should be the one the file was rendered at (as given in
+    the manifest). The average rate of the file differs from it for holds,
+    whose single frame lasts the whole wait, and is only used without it.
+    """
+    with av.open(template_path) as container:
+        template = container.streams.video[0]
+        if frame_rate is None:
+            frame_rate = template.average_rate
+        width, height = template.width, template.height
+    frame_rate = av_frame_rate(frame_rate)
+
+    with av.open(output_path, mode="w") as output:
+        # Stitchable headers do not depend on the content, so they match
+        # those of the other files.
+        stream = output.add_stream(
+            "libx264", rate=frame_rate, options={"crf": "23", "stitchable": "1"}
+        )
+        stream.pix_fmt = "yuv420p"
+        stream.width = width
+        stream.height = height
+
+        frame = frame.reformat(width=width, height=height, format="yuv420p")
+        frame.pts = None
+        for packet in stream.encode(frame):
+            output.mux(packet)
+        for packet in stream.encode():
+            output.mux(packet)
+
+
+def boxes(data):
+    """Yields the `(type, offset, header size, size)` of the MP4 boxes in
+    `data`.
+    """
+    position = 0
+    while position + 8 <= len(data):
+        size, box_type = struct.unpack(">I4s", data[position : position + 8])
+        header_size = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", data[position + 8 : position + 16])
+            header_size = 16
+        elif size == 0:
+            size = len(data) - position
+
+        yield box_type, position, header_size, size
+        position += size
+
+
+def child(data, box_type):
+    """The content of the first child box of `box_type` in `data`."""
+    for child_type, position, header_size, size in boxes(data):
+        if child_type == box_type:
+            return data[position + header_size : position + size]
+
+    return None
+
+
+def fragments(path):
+    """The `(decode time, byte offset)` of each fragment (`moof` box) of a
+    fragmented MP4 file, with the decode time in seconds.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    fragments = list()
+    timescale = None
+    for box_type, position, header_size, size in boxes(data):
+        if box_type not in (b"moov", b"moof"):
+            continue
+
+        content = data[position + header_size : position + size]
+        if box_type == b"moov":
+            # The media header holds the timescale of the (only) track.
+            header = child(child(child(content, b"trak"), b"mdia"), b"mdhd")
+            if header[0] == 1:
+                (timescale,) = struct.unpack(">I", header[20:24])
+            else:
+                (timescale,) = struct.unpack(">I", header[12:16])
+        else:
+            decode_time = child(child(content, b"traf"), b"tfdt")
+            if decode_time[0] == 1:
+                (time,) = struct.unpack(">Q", decode_time[4:12])
+            else:
+                (time,) = struct.unpack(">I", decode_time[4:8])
+            fragments.append((Fraction(time, timescale), position))
+
+    return fragments
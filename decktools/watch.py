@@ -0,0 +1,267 @@
+"""Re-renders slides at preview quality whenever their sources change.
+
+The daemon keeps manim, hmanim and the slide modules imported, so the parsed
+TeX/SVG and text caches stay in memory between renders, and keeps the graphs
+and datasets parsed from data files (see `ParsedDataCache`). A change to
+`slideN.py` re-renders that slide, a change to the template, to
+`mextensions/` or to `vertexcover/` re-renders all slides and a change to a
+data file (e.g. `hrg-large.txt`) re-renders the slides that mention it.
+Unchanged animations are taken from manim's partial movie cache, so only the
+affected segments are rendered again. Results are written to the
+presentation folder.
+
+Run from the repository root:
+
+    python -m decktools.watch [slide1.py slide2.py ...]
+"""
+
+import argparse
+import copy
+import functools
+import hashlib
+import importlib
+import inspect
+import os
+import queue
+import sys
+import time
+import traceback
+
+import numpy as np
+from manim import Mobject, tempconfig
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+import manim_presentation_template
+from decktools.slides import (
+    DATA_EXTENSIONS,
+    ROOT,
+    import_slide,
+    slide_classes,
+    slide_paths,
+)
+
+# Files and packages that are shared by all slides.
+TEMPLATE_FILES = ("manim_presentation_template.py",)
+SHARED_PACKAGES = ("mextensions", "vertexcover")
+
+# The functions that parse data files, whose results are kept between
+# renders, as the module, the name of the function (or static method) and
+# the names of its arguments that are paths of data files.
+CACHED_PARSERS = (
+    ("hmanim.native", "Graph.from_files", ("edge_list_path", "coordinate_list_path")),
+    ("vertexcover.graph", "read_edge_list", ("path",)),
+    ("vertexcover.graph", "read_coordinates", ("path",)),
+    ("vertexcover.dataset", "load_dataset", ("path",)),
+)
+
+# Events arriving within this time (in seconds) are handled together.
+DEBOUNCE_TIME = 0.2
+
+# Folders whose changes are ignored, in addition to the output folder.
+IGNORED_FOLDERS = ("media", "__pycache__", ".git")
+
+
+class ChangeHandler(FileSystemEventHandler):
+    def __init__(self, changes, ignored_folders):
+        self.changes = changes
+        self.ignored_folders = ignored_folders
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+
+        path = os.path.abspath(getattr(event, "dest_path", "") or event.src_path)
+        parts = os.path.relpath(path, ROOT).split(os.sep)
+        if any(folder in self.ignored_folders for folder in parts[:-1]):
+            return
+
+        self.changes.put(path)
+
+
+def argument_key(value):
+    """A hashable key of an argument of a cached parser. Mobjects (e.g., the
+    plane of a graph) are identified by their type and points.
+    """
+    if isinstance(value, Mobject):
+        digest = hashlib.sha256(type(value).__name__.encode())
+        for mobject in value.get_family():
+            digest.update(np.ascontiguousarray(mobject.points).tobytes())
+        return digest.hexdigest()
+
+    return repr(value)
+
+
+class ParsedDataCache:
+    """Keeps the results of the `CACHED_PARSERS` between renders, such that
+    reloaded slides do not parse the same files again. Results are keyed by
+    the paths and modification times of the files and by the other
+    arguments, and each call gets a copy.
+    """
+
+    def __init__(self):
+        self.results = dict()
+
+    def install(self):
+        """Replaces the parsers by caching ones. Has to be called again once
+        their modules were imported again, which also drops the results, as
+        the parsers may have changed.
+        """
+        self.results = dict()
+        for module_name, name, path_arguments in CACHED_PARSERS:
+            try:
+                owner = importlib.import_module(module_name)
+            except ImportError:
+                continue
+
+            *owner_names, function_name = name.split(".")
+            for owner_name in owner_names:
+                owner = getattr(owner, owner_name)
+            function = getattr(owner, function_name)
+            cached = self.cached(name, function, path_arguments)
+            if inspect.isclass(owner):
+                cached = staticmethod(cached)
+            setattr(owner, function_name, cached)
+
+    def cached(self, name, function, path_arguments):
+        # Caching parsers are not wrapped again.
+        function = getattr(function, "uncached", function)
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def cached_function(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = [name]
+            for argument, value in arguments.arguments.items():
+                if argument in path_arguments:
+                    path = os.path.abspath(value)
+                    key.append((path, os.stat(path).st_mtime_ns))
+                else:
+                    key.append((argument, argument_key(value)))
+
+            key = tuple(key)
+            if key not in self.results:
+                self.results[key] = function(*args, **kwargs)
+            return copy.deepcopy(self.results[key])
+
+        cached_function.uncached = function
+        return cached_function
+
+
+class Watcher:
+    def __init__(self, paths, output_folder, quality):
+        self.paths = [os.path.abspath(path) for path in slide_paths(paths)]
+        self.output_folder = output_folder
+        self.quality = quality
+        self.parsed_data = ParsedDataCache()
+        self.parsed_data.install()
+
+    def reload_shared_modules(self):
+        """Reloads the template and forgets the modules of the shared
+        packages, which the slides import again when they are reloaded
+        afterwards. Unlike reloading them one by one, this also renews the
+        names that the modules import from each other (e.g.,
+        `vertexcover.solvers` from `vertexcover.reductions`).
+        """
+        importlib.reload(manim_presentation_template)
+        for name in list(sys.modules):
+            if name.split(".")[0] in SHARED_PACKAGES:
+                del sys.modules[name]
+        self.parsed_data.install()
+
+    def affected_slides(self, changed):
+        """The slide files that have to be re-rendered due to the `changed`
+        files, and whether the shared modules have to be reloaded.
+        """
+        affected = set()
+        shared = False
+        for path in changed:
+            relative_path = os.path.relpath(path, ROOT)
+            if path in self.paths:
+                affected.add(path)
+            elif (
+                relative_path in TEMPLATE_FILES
+                or relative_path.split(os.sep)[0] in SHARED_PACKAGES
+            ):
+                if path.endswith(".py"):
+                    shared = True
+                    affected.update(self.paths)
+            elif path.endswith(DATA_EXTENSIONS):
+                name = os.path.basename(path)
+                for slide_path in self.paths:
+                    with open(slide_path) as f:
+                        if name in f.read():
+                            affected.add(slide_path)
+
+        return sorted(affected, key=self.paths.index), shared
+
+    def render(self, path, reload):
+        module = import_slide(path, reload=reload)
+        for slide_class in slide_classes(module):
+            start = time.perf_counter()
+            with tempconfig(
+                {"quality": self.quality, "preview": False, "input_file": path}
+            ):
+                slide_class(output_folder=self.output_folder).render()
+
+            print(
+                "%s rendered in %.2fs"
+                % (slide_class.__name__, time.perf_counter() - start)
+            )
+
+    def handle(self, changed):
+        affected, shared = self.affected_slides(changed)
+        if not affected:
+            return
+
+        try:
+            if shared:
+                self.reload_shared_modules()
+
+            for path in affected:
+                self.render(path, reload=True)
+        except Exception:
+            # Errors in the slides must not stop the watcher.
+            traceback.print_exc()
+
+    def run(self):
+        changes = queue.Queue()
+        observer = Observer()
+        ignored_folders = IGNORED_FOLDERS + (
+            os.path.basename(os.path.normpath(self.output_folder)),
+        )
+        observer.schedule(ChangeHandler(changes, ignored_folders), ROOT, recursive=True)
+        observer.start()
+
+        # Render everything once, which also warms up the caches.
+        self.handle(self.paths)
+        print("Watching for changes...")
+
+        try:
+            while True:
+                changed = {changes.get()}
+                time.sleep(DEBOUNCE_TIME)
+                while not changes.empty():
+                    changed.add(changes.get())
+
+                self.handle(changed)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("slides", nargs="*", help="the slide files to watch")
+    parser.add_argument("--output-folder", default="./presentation")
+    parser.add_argument("--quality", default="low_quality")
+    args = parser.parse_args()
+
+    Watcher(args.slides, args.output_folder, args.quality).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,476 @@
 from __future__ import annotations
 
+import hashlib
+import importlib
+import inspect
 import json
+import marshal
 import os
+import pickle
 import shutil
+import types
 from typing import Iterable, Sequence
 
+import av
+import numpy as np
 from manim import (
+    DEFAULT_WAIT_TIME,
     DOWN,
     LIGHT_GRAY,
     UP,
     Animation,
-    Dot,
+    CairoRenderer,
     FadeIn,
     FadeOut,
     Group,
+    MovingCamera,
     MovingCameraScene,
+    Rectangle,
+    SceneFileWriter,
     Tex,
     Text,
+    Wait,
     config,
+    logger,
 )
+from manim.scene.scene_file_writer import to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+from PIL import Image
+
+from decktools import cache
+from decktools.slides import local_module_paths, mentioned_data_files
+
+
+class DryRunRenderer(CairoRenderer):
+    """A renderer that executes all animations of a scene without
+    rasterizing or encoding any frame. The scene time still advances by the
+    run time of each animation.
+    """
+
+    def __init__(self, **kwargs):
+        super(DryRunRenderer, self).__init__(skip_animations=True, **kwargs)
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+
+def make_function(code, module_name, name, defaults, cell_count):
+    """The function with the marshalled `code`, in the namespace of the
+    module `module_name`, whose closure is filled by `fill_closure`.
+    """
+    return types.FunctionType(
+        marshal.loads(code),
+        importlib.import_module(module_name).__dict__,
+        name,
+        defaults,
+        tuple(types.CellType() for _ in range(cell_count)),
+    )
+
+
+def fill_closure(function, values):
+    for index, value in values.items():
+        function.__closure__[index].cell_contents = value
+
+
+class CheckpointPickler(pickle.Pickler):
+    """A pickler that also stores functions that cannot be imported by their
+    name, such as lambdas and functions defined inside of `content`, which
+    slides attach as updaters. They are stored by their code and the values
+    of their closure, which keep referring to the same mobjects as the
+    rest of the checkpoint.
+    """
+
+    def reducer_override(self, obj):
+        if not isinstance(obj, types.FunctionType) or not (
+            obj.__name__ == "<lambda>" or "<locals>" in obj.__qualname__
+        ):
+            return NotImplemented
+
+        cells = obj.__closure__ or ()
+        values = dict()
+        for index, cell in enumerate(cells):
+            try:
+                values[index] = cell.cell_contents
+            except ValueError:
+                # The variable was not assigned yet.
+                pass
+
+        # The closure is filled only after the function is memoized, such
+        # that mobjects in it may refer back to the function.
+        arguments = (
+            marshal.dumps(obj.__code__),
+            obj.__module__,
+            obj.__name__,
+            obj.__defaults__,
+            len(cells),
+        )
+        return make_function, arguments, values, None, None, fill_closure
+
+
+class PresentationFileWriter(SceneFileWriter):
+    """A file writer that encodes, next to each partial movie file, one
+    downscaled rendition per height in `renditions`. Each frame is only
+    rasterized once, at the resolution of the scene, and then resized for
+    the renditions in the same pass.
+
+    With a `segment_store` folder (e.g., on a shared mount), each written
+    partial movie file and its renditions are published there under the
+    hash of their `play` call, and files missing locally are fetched from
+    there instead of being rendered again.
+
+    While `hold_duration` is set, the single frame of a static wait is
+    written as one packet that lasts that many seconds, see
+    `PresentationSlide.wait`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(PresentationFileWriter, self).__init__(*args, **kwargs)
+        self.renditions = list()
+        self.rendition_outputs = list()
+        self.segment_store = None
+        self.hold_duration = None
+
+    @staticmethod
+    def rendition_path(file_path, height):
+        root, extension = os.path.splitext(str(file_path))
+        return "%s.%dp%s" % (root, height, extension)
+
+    @staticmethod
+    def copy_atomically(src_file, dst_file):
+        """Copies `src_file` such that others never see a partial `dst_file`."""
+        os.makedirs(os.path.dirname(dst_file), exist_ok=True)
+        temporary_file = "%s.%d.tmp" % (dst_file, os.getpid())
+        shutil.copyfile(src_file, temporary_file)
+        os.replace(temporary_file, dst_file)
+
+    def rendition_heights(self):
+        # Only renditions that are smaller than the scene itself are derived.
+        return [height for height in self.renditions if height < config.pixel_height]
+
+    def segment_files(self, file_path):
+        """The partial movie file at `file_path` and its renditions."""
+        return [str(file_path)] + [
+            PresentationFileWriter.rendition_path(file_path, height)
+            for height in self.rendition_heights()
+        ]
+
+    def store_path(self, file_path):
+        # Files are spread over subfolders by the first characters of their
+        # hash, such that no folder of the store gets too large.
+        name = os.path.basename(file_path)
+        return os.path.join(self.segment_store, name[:2], name)
+
+    def publish_segment(self, file_path):
+        if self.segment_store is None:
+            return
+
+        for file in self.segment_files(file_path):
+            if not os.path.exists(self.store_path(file)):
+                PresentationFileWriter.copy_atomically(file, self.store_path(file))
+
+    def fetch_segment(self, file_path):
+        """Copies the segment at `file_path` from the store, if it is there."""
+        files = self.segment_files(file_path)
+        if self.segment_store is None or not all(
+            os.path.exists(self.store_path(file)) for file in files
+        ):
+            return False
+
+        for file in files:
+            PresentationFileWriter.copy_atomically(self.store_path(file), file)
+        logger.info("Fetched %s from the segment store", file_path)
+        return True
+
+    def is_already_cached(self, hash_invocation):
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+
+        file_path = self.partial_movie_directory / (
+            hash_invocation + config["movie_file_extension"]
+        )
+        if all(os.path.exists(file) for file in self.segment_files(file_path)):
+            # Segments rendered before the store was configured are
+            # published as well.
+            self.publish_segment(file_path)
+            return True
+
+        return self.fetch_segment(file_path)
+
+    def open_partial_movie_stream(self, file_path=None):
+        self.rendition_outputs = list()
+        for height in self.rendition_heights():
+            # Encoders require even dimensions.
+            width = round(config.pixel_width * height / config.pixel_height)
+            width, height = width - width % 2, height - height % 2
+
+            if file_path is None:
+                file_path = self.partial_movie_files[self.renderer.num_plays]
+            container = av.open(
+                PresentationFileWriter.rendition_path(file_path, height), mode="w"
+            )
+            stream = container.add_stream(
+                "libx264",
+                rate=to_av_frame_rate(config.frame_rate),
+                options={"crf": "23"},
+            )
+            stream.pix_fmt = "yuv420p"
+            stream.width = width
+            stream.height = height
+            self.rendition_outputs.append((container, stream))
+
+        super(PresentationFileWriter, self).open_partial_movie_stream(file_path)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        super(PresentationFileWriter, self).encode_and_write_frame(frame, num_frames)
+
+        image = Image.fromarray(frame)
+        for container, stream in self.rendition_outputs:
+            scaled_frame = np.asarray(
+                image.resize((stream.width, stream.height), Image.BILINEAR)
+            )
+            for _ in range(num_frames):
+                av_frame = av.VideoFrame.from_ndarray(scaled_frame, format="rgba")
+                for packet in stream.encode(av_frame):
+                    container.mux(packet)
+
+    def flush(self, container, stream):
+        """Writes the frames that the encoder of `stream` still holds."""
+        for packet in stream.encode():
+            if self.hold_duration is not None:
+                packet.duration = max(
+                    packet.duration, round(self.hold_duration / packet.time_base)
+                )
+            container.mux(packet)
+
+    def close_partial_movie_stream(self):
+        if self.hold_duration is None:
+            super(PresentationFileWriter, self).close_partial_movie_stream()
+        else:
+            # Like manim, but the held frame only leaves the encoder when it
+            # is flushed, which can only happen once.
+            self.queue.put((-1, None))
+            self.writer_thread.join()
+            self.flush(self.video_container, self.video_stream)
+            self.video_container.close()
+
+        for container, stream in self.rendition_outputs:
+            self.flush(container, stream)
+            container.close()
+        self.rendition_outputs = list()
+
+        self.publish_segment(self.partial_movie_file_path)
 
 
 class PresentationSlide(MovingCameraScene):
+    # Static waits are encoded as a single frame that is held for the
+    # duration of the wait, see `wait`.
+    hold_static_waits = True
+
+    # The frame rate of animations without motion (static waits and fades
+    # that neither shift nor scale), see `segment_frame_rate`. None keeps the
+    # frame rate of the quality preset for all animations.
+    low_motion_frame_rate = 15
+
+    # The shortest run time (in seconds) of fades that are rendered at the
+    # low motion frame rate. Shorter fades would only get a few frames.
+    low_motion_min_fade_time = 0.5
+
+    # The heights of downscaled renditions of each partial movie file, see
+    # `PresentationFileWriter`.
+    renditions = ()
+
+    # The width of the thumbnail captured at each pause, see
+    # `capture_thumbnail`. None disables thumbnails.
+    thumbnail_width = 240
+    thumbnails_per_row = 10
+
+    # The maximum size of the partial movie files in the media folder, e.g.,
+    # "10G", see `decktools.cache`. None never deletes cached files.
+    media_cache_budget = None
+
+    # A folder shared by several machines, in which rendered partial movie
+    # files are published and from which they are fetched, see
+    # `PresentationFileWriter`. None only uses the local media folder.
+    segment_store = None
+
     def __init__(self, *args, **kwargs):
         self.output_folder = kwargs.pop("output_folder", "./presentation")
+
+        # The name of the checkpoint from which the slide should be resumed,
+        # see `resume`.
+        self.resume_from = kwargs.pop(
+            "resume_from", os.environ.get("PRESENTATION_RESUME_FROM")
+        )
+
+        # The heights of the downscaled renditions that are derived from the
+        # rendered frames, e.g., `[720, 480]` or `PRESENTATION_RENDITIONS=720,480`.
+        renditions = kwargs.pop(
+            "renditions", os.environ.get("PRESENTATION_RENDITIONS", self.renditions)
+        )
+        if isinstance(renditions, str):
+            renditions = [int(height) for height in renditions.split(",") if height]
+
+        self.media_cache_budget = kwargs.pop(
+            "media_cache_budget",
+            os.environ.get("PRESENTATION_MEDIA_BUDGET", self.media_cache_budget),
+        )
+        segment_store = kwargs.pop(
+            "segment_store",
+            os.environ.get("PRESENTATION_SEGMENT_STORE", self.segment_store),
+        )
+
+        # In a dry run (`manim --dry_run`) we only care about the structure of
+        # the slide, i.e., the animations and pauses.
+        if config["dry_run"] and "renderer" not in kwargs:
+            kwargs["renderer"] = DryRunRenderer(camera_class=MovingCamera)
+        elif "renderer" not in kwargs:
+            kwargs["renderer"] = CairoRenderer(
+                file_writer_class=PresentationFileWriter,
+                camera_class=MovingCamera,
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+
         super(PresentationSlide, self).__init__(*args, **kwargs)
+        self.renderer.file_writer.renditions = list(renditions)
+        self.renderer.file_writer.segment_store = segment_store
         self.slides = list()
+        self.animation_data = list()
         self.current_slide = 1
         self.current_animation = 0
         self.loop_start_animation = None
         self.pause_start_animation = 0
-
-    def play(self, *args, **kwargs):
-        super(PresentationSlide, self).play(*args, **kwargs)
+        self.checkpoint_variables = dict()
+        self.thumbnails = list()
+
+        # Whether the pixel array of the camera shows the current frame.
+        self.frame_is_current = False
+
+    def play(self, *args, frame_rate=None, **kwargs):
+        """Plays the animations as one segment. Its frame rate is
+        `frame_rate` if given, and otherwise chosen by `segment_frame_rate`.
+        """
+        if frame_rate is None:
+            frame_rate = self.segment_frame_rate(args, kwargs.get("run_time"))
+
+        full_frame_rate = self.camera.frame_rate
+        self.camera.frame_rate = frame_rate
+        config["frame_rate"] = frame_rate
+
+        start_time = self.time
+        try:
+            super(PresentationSlide, self).play(*args, **kwargs)
+        finally:
+            self.camera.frame_rate = full_frame_rate
+            config["frame_rate"] = full_frame_rate
+
+        self.animation_data.append(
+            dict(duration=self.time - start_time, frame_rate=frame_rate)
+        )
         self.current_animation += 1
+        self.frame_is_current = not self.renderer.skip_animations
+
+    def segment_frame_rate(self, animations, run_time=None):
+        """The reduced `low_motion_frame_rate` if none of the `animations`
+        (played for `run_time` seconds, if given) moves anything, i.e., they
+        are static waits or fades without shift and scale that last at least
+        `low_motion_min_fade_time`, and no time-based updaters run.
+        Otherwise, the frame rate of the camera.
+        """
+        if self.low_motion_frame_rate is None:
+            return self.camera.frame_rate
+
+        def is_low_motion(animation):
+            if isinstance(animation, Wait):
+                return self.is_static_wait(
+                    animation.stop_condition, animation.is_static_wait
+                )
+            if isinstance(animation, (FadeIn, FadeOut)):
+                fade_time = animation.run_time if run_time is None else run_time
+                return (
+                    not any(animation.shift_vector)
+                    and animation.scale_factor == 1
+                    and fade_time >= self.low_motion_min_fade_time
+                    and not self.has_time_based_updaters(animation.mobject.get_family())
+                )
+            return False
+
+        if all(is_low_motion(animation) for animation in animations):
+            return min(self.low_motion_frame_rate, self.camera.frame_rate)
+
+        return self.camera.frame_rate
+
+    def wait(
+        self,
+        duration=DEFAULT_WAIT_TIME,
+        stop_condition=None,
+        frozen_frame=None,
+    ):
+        """Waits for `duration` seconds. If nothing can change during the
+        wait, only a single frame is rendered and encoded, as one packet
+        that lasts `duration` seconds, so the movies that manim combines
+        keep the wait. The animation is marked as `hold` in the manifest,
+        such that players show that frame for `duration` seconds without
+        decoding further.
+        """
+        if not self.hold_static_waits or not self.is_static_wait(
+            stop_condition, frozen_frame
+        ):
+            super(PresentationSlide, self).wait(
+                duration, stop_condition=stop_condition, frozen_frame=frozen_frame
+            )
+            return
+
+        frame_rate = self.camera.frame_rate
+        if self.low_motion_frame_rate is not None:
+            frame_rate = min(self.low_motion_frame_rate, frame_rate)
+        hold = Wait(run_time=1.0 / frame_rate, frozen_frame=True)
+
+        # The duration is part of the hash of the animation, so holds of
+        # different lengths are cached separately.
+        hold.hold_duration = duration
+        file_writer = self.renderer.file_writer
+        file_writer.hold_duration = duration
+        start_time = self.renderer.time
+        try:
+            self.play(hold, frame_rate=frame_rate)
+        finally:
+            file_writer.hold_duration = None
+
+        # Playing the hold only advanced the time by one frame, but sounds
+        # and subcaptions added later have to start after the whole wait.
+        self.renderer.time = start_time + duration
+        self.animation_data[-1].update(duration=duration, hold=True)
+
+    def is_static_wait(self, stop_condition=None, frozen_frame=None):
+        """Whether a wait would show a frozen frame, following the rules of
+        :meth:`Scene.should_update_mobjects`.
+        """
+        if frozen_frame is not None:
+            return frozen_frame
+
+        return stop_condition is None and not self.has_time_based_updaters()
+
+    def has_time_based_updaters(self, mobjects=()):
+        """Whether the scene, its mobjects or the `mobjects` (e.g., those
+        that an animation is about to add) change over time by themselves.
+        """
+        return bool(
+            self.always_update_mobjects
+            or self.updaters
+            or any(
+                mob.has_time_based_updater()
+                for mob in [*self.get_mobject_family_members(), *mobjects]
+            )
+        )
 
     def pause(self):
+        """Marks a segment boundary. Every `play` already writes its own
+        partial movie file, so the boundary is only recorded in `self.slides`
+        and nothing is rendered. A slide without animations (two pauses in a
+        row) has `start_animation == end_animation` and is shown by holding
+        the last frame.
+        """
+        self.capture_thumbnail()
         self.slides.append(
             dict(
                 type="slide",
@@ -47,6 +482,215 @@ class PresentationSlide(MovingCameraScene):
         self.current_slide += 1
         self.pause_start_animation = self.current_animation
 
+    def capture_thumbnail(self):
+        """Keeps a downscaled copy of the current frame for the slide that
+        ends here. The renderer still holds the last frame of the previous
+        animation, it only has to be rasterized if that animation was not
+        rendered (e.g., since it was cached).
+        """
+        if config["dry_run"] or self.thumbnail_width is None:
+            return
+
+        if not self.frame_is_current:
+            self.renderer.static_image = None
+            self.renderer.update_frame(self, ignore_skipping=True)
+            self.frame_is_current = True
+
+        image = Image.fromarray(self.renderer.get_frame())
+        height = round(image.height * self.thumbnail_width / image.width)
+        self.thumbnails.append(
+            image.resize((self.thumbnail_width, height), Image.BILINEAR)
+        )
+
+    def write_thumbnails(self, folder):
+        """Writes the thumbnails of the slides to `folder/thumbnails` and
+        combines them into a sprite sheet `folder/thumbnails.png`. The
+        location of each thumbnail in the sprite sheet is added to its slide.
+        """
+        if not self.thumbnails:
+            return None
+
+        thumbnails_folder = os.path.join(folder, "thumbnails")
+        if not os.path.exists(thumbnails_folder):
+            os.mkdir(thumbnails_folder)
+
+        width, height = self.thumbnails[0].size
+        columns = min(len(self.thumbnails), self.thumbnails_per_row)
+        rows = -(-len(self.thumbnails) // columns)
+        sprite_sheet = Image.new("RGBA", (columns * width, rows * height))
+
+        for index, (slide, thumbnail) in enumerate(zip(self.slides, self.thumbnails)):
+            path = os.path.join(thumbnails_folder, "%d.png" % slide["number"])
+            thumbnail.save(path)
+
+            x, y = (index % columns) * width, (index // columns) * height
+            sprite_sheet.paste(thumbnail, (x, y))
+            slide["thumbnail"] = path
+            slide["sprite"] = dict(x=x, y=y, width=width, height=height)
+
+        sprite_sheet_path = os.path.join(folder, "thumbnails.png")
+        sprite_sheet.save(sprite_sheet_path)
+        return sprite_sheet_path
+
+    def register(self, **variables):
+        """Registers Python-side variables of the slide that are stored in the
+        checkpoints and handed back by `resume`.
+        """
+        self.checkpoint_variables.update(variables)
+
+    def checkpoint_path(self, name):
+        return os.path.join(
+            self.output_folder,
+            "checkpoints",
+            type(self).__name__,
+            "%s-%dp%d.pickle" % (name, config["pixel_height"], config["frame_rate"]),
+        )
+
+    @staticmethod
+    def checkpoint_dependencies(file_name):
+        """The files besides the slide code that a checkpoint of the slide in
+        `file_name` depends on: the modules of the repository that are
+        imported (including this template) and the data files that they or
+        the slide mention.
+        """
+        modules = local_module_paths()
+        return modules + mentioned_data_files([file_name] + modules)
+
+    @staticmethod
+    def source_fingerprint(file_name, line_number, dependencies):
+        """Hash of the slide code up to (and including) `line_number` and of
+        the files in `dependencies`. A checkpoint is invalid once this
+        changes.
+        """
+        digest = hashlib.sha256()
+        with open(file_name, "rb") as f:
+            digest.update(b"".join(f.readlines()[:line_number]))
+        for path in dependencies:
+            digest.update(path.encode())
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def checkpoint(self, name):
+        """Stores the mobjects, the camera frame, the registered variables
+        and the progress of the renderer on disk, such that a later render
+        can `resume` from here. Checkpoints are independent of the slides,
+        so the rendered slide is the same with or without them.
+        """
+        if config["dry_run"]:
+            return
+
+        # The first frame outside of this template is the slide code that
+        # took the checkpoint.
+        frame = inspect.currentframe()
+        while frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        file_name, line_number = frame.f_code.co_filename, frame.f_lineno
+        dependencies = PresentationSlide.checkpoint_dependencies(file_name)
+
+        file_writer = self.renderer.file_writer
+        state = dict(
+            file_name=file_name,
+            line_number=line_number,
+            dependencies=dependencies,
+            fingerprint=PresentationSlide.source_fingerprint(
+                file_name, line_number, dependencies
+            ),
+            mobjects=self.mobjects,
+            foreground_mobjects=self.foreground_mobjects,
+            camera_frame=self.camera.frame,
+            variables=self.checkpoint_variables,
+            slides=self.slides,
+            animation_data=self.animation_data,
+            current_slide=self.current_slide,
+            current_animation=self.current_animation,
+            loop_start_animation=self.loop_start_animation,
+            pause_start_animation=self.pause_start_animation,
+            partial_movie_files=file_writer.partial_movie_files,
+            animations_hashes=self.renderer.animations_hashes,
+            num_plays=self.renderer.num_plays,
+            time=self.renderer.time,
+            thumbnails=self.thumbnails,
+        )
+
+        path = self.checkpoint_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            with open(path, "wb") as f:
+                CheckpointPickler(f).dump(state)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            # E.g., updaters that refer to the scene itself, which holds the
+            # open movie files.
+            os.remove(path)
+            logger.warning(
+                "Could not store checkpoint %s of %s: %s",
+                name,
+                type(self).__name__,
+                error,
+            )
+
+    def resume(self, name):
+        """Restores the scene state stored at the checkpoint `name`, if it is
+        the one to resume from (`self.resume_from`).
+
+        Returns the registered variables of the checkpoint, or None if there
+        is nothing to resume from (another or no checkpoint requested,
+        missing or outdated checkpoint). The slide then has to be executed
+        from the start:
+
+            variables = self.resume("graph")
+            if variables is None:
+                ...  # Everything up to the checkpoint.
+                self.register(graph=graph)
+                self.checkpoint("graph")
+                variables = self.checkpoint_variables
+            graph = variables["graph"]
+        """
+        if self.resume_from != name or config["dry_run"]:
+            return None
+
+        path = self.checkpoint_path(name)
+        if not os.path.exists(path):
+            logger.warning("There is no checkpoint at %s", path)
+            return None
+
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+
+        if PresentationSlide.source_fingerprint(
+            state["file_name"], state["line_number"], state["dependencies"]
+        ) != state["fingerprint"] or not all(
+            os.path.exists(file)
+            for file in state["partial_movie_files"]
+            if file is not None
+        ):
+            logger.warning("The checkpoint at %s is outdated", path)
+            return None
+
+        self.mobjects = state["mobjects"]
+        self.foreground_mobjects = state["foreground_mobjects"]
+        self.camera.frame = state["camera_frame"]
+        self.checkpoint_variables = state["variables"]
+        self.slides = state["slides"]
+        self.animation_data = state["animation_data"]
+        self.current_slide = state["current_slide"]
+        self.current_animation = state["current_animation"]
+        self.loop_start_animation = state["loop_start_animation"]
+        self.pause_start_animation = state["pause_start_animation"]
+        self.thumbnails = state["thumbnails"]
+
+        file_writer = self.renderer.file_writer
+        file_writer.partial_movie_files = list(state["partial_movie_files"])
+        file_writer.sections[-1].partial_movie_files = list(
+            state["partial_movie_files"]
+        )
+        self.renderer.animations_hashes = list(state["animations_hashes"])
+        self.renderer.num_plays = state["num_plays"]
+        self.renderer.time = state["time"]
+
+        return self.checkpoint_variables
+
     def start_loop(self):
         assert self.loop_start_animation is None, "You cant nest loops"
         self.loop_start_animation = self.current_animation
@@ -55,6 +699,7 @@ class PresentationSlide(MovingCameraScene):
         assert (
             self.loop_start_animation is not None
         ), "You have to start a loop before ending it"
+        self.capture_thumbnail()
         self.slides.append(
             dict(
                 type="loop",
@@ -76,6 +721,16 @@ class PresentationSlide(MovingCameraScene):
 
         config["max_files_cached"] = max_files_cached
 
+        assert (
+            self.loop_start_animation is None
+        ), "You have to end a loop before the slide ends"
+
+        # Dry runs write their manifest to a separate folder, such that they
+        # do not replace the manifests of the rendered slides.
+        if config["dry_run"]:
+            self.write_manifest(os.path.join(self.output_folder, "dry-run"), [])
+            return
+
         if not os.path.exists(self.output_folder):
             os.mkdir(self.output_folder)
 
@@ -86,20 +741,94 @@ class PresentationSlide(MovingCameraScene):
         scene_name = type(self).__name__
         scene_files_folder = os.path.join(files_folder, scene_name)
 
-        if os.path.exists(scene_files_folder):
-            shutil.rmtree(scene_files_folder)
-
         if not os.path.exists(scene_files_folder):
             os.mkdir(scene_files_folder)
 
+        # The partial movie files are named by their hash, so files that are
+        # already in the folder are up to date and only the others have to be
+        # copied. Files of earlier renders that are no longer used are
+        # removed.
+        src_files = self.renderer.file_writer.partial_movie_files
+        used_names = set()
+        for src_file in src_files:
+            used_names.update(
+                os.path.basename(file)
+                for file in self.renderer.file_writer.segment_files(src_file)
+            )
+        for name in os.listdir(scene_files_folder):
+            path = os.path.join(scene_files_folder, name)
+            if name in used_names:
+                continue
+
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
         files = list()
-        for src_file in self.renderer.file_writer.partial_movie_files:
+        used_files = list()
+        for index, src_file in enumerate(src_files):
             dst_file = os.path.join(scene_files_folder, os.path.basename(src_file))
-            shutil.copyfile(src_file, dst_file)
+            if not os.path.exists(dst_file):
+                shutil.copyfile(src_file, dst_file)
             files.append(dst_file)
+            used_files.append(src_file)
+
+            renditions = dict()
+            for height in self.renderer.file_writer.rendition_heights():
+                src_rendition = PresentationFileWriter.rendition_path(src_file, height)
+                if not os.path.exists(src_rendition):
+                    continue
+
+                dst_rendition = os.path.join(
+                    scene_files_folder, os.path.basename(src_rendition)
+                )
+                if not os.path.exists(dst_rendition):
+                    shutil.copyfile(src_rendition, dst_rendition)
+                renditions["%dp" % height] = dst_rendition
+                used_files.append(src_rendition)
+
+            if renditions:
+                self.animation_data[index]["renditions"] = renditions
+
+        sprite_sheet = self.write_thumbnails(scene_files_folder)
+        self.write_manifest(self.output_folder, files, sprite_sheet)
+
+        # The files of this slide are the most recently used ones, and are
+        # protected by its manifest anyway.
+        cache.touch(used_files)
+        if self.media_cache_budget is not None:
+            deleted, size = cache.collect(
+                config.media_dir,
+                cache.parse_size(self.media_cache_budget),
+                self.output_folder,
+            )
+            if deleted:
+                logger.info(
+                    "Deleted %d cached partial movie files, %s remain",
+                    len(deleted),
+                    cache.format_size(size),
+                )
+
+    def write_manifest(self, folder, files, sprite_sheet=None):
+        """Writes the slides, the partial movie files and the (measured or,
+        in a dry run, estimated) duration of each animation to
+        `folder/<Scene>.json`.
+        """
+        if not os.path.exists(folder):
+            os.makedirs(folder)
 
-        f = open(os.path.join(self.output_folder, "%s.json" % (scene_name,)), "w")
-        json.dump(dict(slides=self.slides, files=files), f)
+        scene_name = type(self).__name__
+        f = open(os.path.join(folder, "%s.json" % (scene_name,)), "w")
+        json.dump(
+            dict(
+                slides=self.slides,
+                files=files,
+                animations=self.animation_data,
+                sprite_sheet=sprite_sheet,
+            ),
+            f,
+        )
         f.close()
 
 
@@ -130,7 +859,6 @@ class DefaultSlide(PresentationSlide):
             self.play(*animations)
 
         self.pause()
-        self.play(FadeIn(Dot(radius=0), run_time=0.01))
 
     # Deprecated.
     def click_object(self, obj):
@@ -154,7 +882,7 @@ class DefaultSlide(PresentationSlide):
         if run_time is None:
             run_time = DefaultSlide.defaultAnimationRunTime
 
-        text = Text(title).scale(DefaultSlide.headerScale).shift(UP * 3)
+        text = HeaderText(title).shift(UP * 3)
         if with_click:
             self.click(FadeIn(text, run_time=run_time))
 
@@ -170,10 +898,37 @@ class DefaultSlide(PresentationSlide):
         self.content()
 
 
-class ContentText(Text):
+class CachedText(Text):
+    """A :class:`Text` whose Pango outlines are generated only once per string
+    and style.
+
+    The first instance for a given combination of string, class (and thus
+    scale) and keyword arguments (font, weight, t2c, color, ...) is rendered
+    by Pango and kept as prototype. Later instances are copies of that
+    prototype.
+    """
+
+    text_scale = 1.0
+    prototypes = dict()
+
     def __init__(self, *texts, **kwargs):
+        key = (type(self).__name__, texts, repr(sorted(kwargs.items())))
+        prototype = CachedText.prototypes.get(key)
+        if prototype is not None:
+            self.__dict__.update(prototype.copy().__dict__)
+            return
+
         super().__init__(*texts, **kwargs)
-        self.scale(DefaultSlide.contentScale)
+        self.scale(self.text_scale)
+        CachedText.prototypes[key] = self.copy()
+
+
+class HeaderText(CachedText):
+    text_scale = DefaultSlide.headerScale
+
+
+class ContentText(CachedText):
+    text_scale = DefaultSlide.contentScale
 
 
 class ContentTex(Tex):
@@ -182,10 +937,11 @@ class ContentTex(Tex):
         self.scale(DefaultSlide.contentTexScale)
 
 
-class SideNoteText(Text):
+class SideNoteText(CachedText):
+    text_scale = DefaultSlide.sideNoteScale
+
     def __init__(self, *texts, **kwargs):
         super().__init__(*texts, color=LIGHT_GRAY, **kwargs)
-        self.scale(DefaultSlide.sideNoteScale)
 
 
 class SideNoteTex(Tex):
@@ -195,17 +951,37 @@ class SideNoteTex(Tex):
 
 
 class Bullet(Group):
+    # The line metrics (width, height, center) of the ghost per text style.
+    ghost_metrics = dict()
+
     def __init__(self, text: ContentText, **kwargs):
         # The ghost ensures that the bullet has the maximum text height,
         # such that multiple bullets are aligned evenly.
-        ghost = ContentText(
-            "jI",
-            stroke_opacity=0,
-            fill_opacity=0,
-        )
+        ghost = Bullet.ghost(ContentText)
         text.align_to(ghost, UP)
         super().__init__(ghost, text, **kwargs)
 
+    @staticmethod
+    def ghost(text_class):
+        """An invisible box with the line metrics of `text_class`. The metrics
+        are measured on "jI" (ascender and descender) once per text class.
+        """
+        if text_class not in Bullet.ghost_metrics:
+            reference = text_class("jI")
+            Bullet.ghost_metrics[text_class] = (
+                reference.width,
+                reference.height,
+                reference.get_center(),
+            )
+
+        width, height, center = Bullet.ghost_metrics[text_class]
+        return Rectangle(
+            width=width,
+            height=height,
+            stroke_opacity=0,
+            fill_opacity=0,
+        ).move_to(center)
+
     @staticmethod
     def group(*texts: Sequence[Text], **kwargs):
         bullets = [Bullet(text) for text in texts]
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Iterable, Sequence
 
-from manim import DOWN, UP, BarChart, config
+import numpy as np
+from manim import Animation, BarChart, Rectangle, color_to_rgb, config
 
 
 class RecolorableBarChart(BarChart):
@@ -38,6 +39,88 @@ class RecolorableBarChart(BarChart):
             **kwargs,
         )
 
+        # The points of a bar of width and height 1 whose bottom edge is
+        # centered at the origin, from which the bars are computed.
+        template = Rectangle(width=1.0, height=1.0).points
+        self.bar_template_x = template[:, 0]
+        self.bar_template_y = template[:, 1] + 0.5
+
+    def bar_points(self, values: np.ndarray) -> np.ndarray:
+        """The points of bars showing `values`, with one row per bar. Bars
+        with negative values extend below the x-axis.
+        """
+        # The axes map coordinates linearly, also after the chart was moved,
+        # scaled or rotated.
+        origin = self.c2p(0, 0)
+        x_unit = self.c2p(1, 0) - origin
+        y_unit = self.c2p(0, 1) - origin
+
+        x = np.arange(len(values))[:, None] + 0.5
+        x = x + self.bar_template_x[None, :] * self.bar_width
+        y = values[:, None] * self.bar_template_y[None, :]
+        return origin + x[:, :, None] * x_unit + y[:, :, None] * y_unit
+
+    def link_bars(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The points, fill colors and stroke colors of all bars, as arrays
+        with one entry per bar, of which the arrays of the bars are views.
+        Writing to them updates all bars with a single assignment. Bars whose
+        arrays were replaced since (e.g., by copying, moving or transforming
+        the chart) are linked again.
+        """
+        arrays = getattr(self, "bar_arrays", None)
+        if arrays is not None and all(
+            bar.points.base is arrays[0]
+            and bar.fill_rgbas.base is arrays[1]
+            and bar.stroke_rgbas.base is arrays[2]
+            for bar in self.bars
+        ):
+            return arrays
+
+        points = self.bar_points(np.asarray(self.values, dtype=float))
+        fills = np.stack([bar.fill_rgbas[:1] for bar in self.bars])
+        strokes = np.stack([bar.stroke_rgbas[:1] for bar in self.bars])
+        for i, bar in enumerate(self.bars):
+            bar.points, bar.fill_rgbas, bar.stroke_rgbas = (
+                points[i],
+                fills[i],
+                strokes[i],
+            )
+
+        self.bar_arrays = points, fills, strokes
+        return self.bar_arrays
+
+    def set_values(self, values: Iterable[float]):
+        """Sets the height of the first `len(values)` bars to `values`."""
+        values = np.asarray(list(values), dtype=float)[: len(self.bars)]
+        points, _, _ = self.link_bars()
+        points[: len(values)] = self.bar_points(values)
+
+        self.values[: len(values)] = list(values)
+        return self
+
+    def get_colors(self) -> np.ndarray:
+        """The RGB color of each bar, with one row per bar."""
+        _, fills, _ = self.link_bars()
+        return fills[:, 0, :3].copy()
+
+    def set_colors(self, colors):
+        """Sets the fill and stroke color of the bars, keeping their
+        opacities. `colors` is a single color, a sequence of colors or an
+        array of RGB rows.
+        """
+        if isinstance(colors, np.ndarray):
+            rgbs = colors
+        elif isinstance(colors, str) or not isinstance(colors, Iterable):
+            rgbs = np.tile(color_to_rgb(colors), (len(self.bars), 1))
+        else:
+            rgbs = np.array([color_to_rgb(color) for color in colors])
+
+        _, fills, strokes = self.link_bars()
+        rgbs = rgbs[: len(fills), None, :]
+        fills[: len(rgbs), :, :3] = rgbs
+        strokes[: len(rgbs), :, :3] = rgbs
+        return self
+
     def change_bar_values_and_color(self, values: Iterable[float], new_color):
         """Updates the height of the bars of the chart and changes the color of the bars.
 
@@ -66,36 +149,46 @@ class RecolorableBarChart(BarChart):
                     chart.change_bar_values(list(reversed(values)))
                     self.add(chart.get_bar_labels(font_size=24))
         """
+        values = list(values)[: len(self.bars)]
+        return self.set_values(values).set_colors([new_color] * len(values))
 
-        for i, (bar, value) in enumerate(zip(self.bars, values)):
-            chart_val = self.values[i]
-
-            if chart_val > 0:
-                bar_lim = bar.get_bottom()
-                aligned_edge = DOWN
-            else:
-                bar_lim = bar.get_top()
-                aligned_edge = UP
-
-            try:
-                quotient = value / chart_val
-                if quotient < 0:
-
-                    aligned_edge = UP if chart_val > 0 else DOWN
-
-                    # if the bar is already positive, then we now want to move it
-                    # so that it is negative. So, we move the top edge of the bar
-                    # to the location of the previous bottom
-
-                    # if already negative, then we move the bottom edge of the bar
-                    # to the location of the previous top
 
-                bar.stretch_to_fit_height(quotient * bar.height)
+class ChangeBarValues(Animation):
+    """Animates the bars of a :class:`RecolorableBarChart` from their current
+    values (and colors) to `values` (and `colors`). All bars are computed at
+    once in each frame, and bars may start or end at zero.
+    """
 
-            except ZeroDivisionError:
-                bar.height = 0
-
-            bar.move_to(bar_lim, aligned_edge)
-            bar.set_color(new_color)
-
-        self.values[: len(values)] = values
+    def __init__(
+        self,
+        chart: RecolorableBarChart,
+        values: Iterable[float],
+        colors=None,
+        **kwargs,
+    ):
+        self.target_values = np.asarray(list(values), dtype=float)
+        self.target_colors = colors
+        super().__init__(chart, **kwargs)
+
+    def begin(self):
+        chart = self.mobject
+        count = min(len(self.target_values), len(chart.bars))
+        self.target_values = self.target_values[:count]
+        self.start_values = np.asarray(chart.values[:count], dtype=float)
+
+        self.start_colors = chart.get_colors()
+        self.end_colors = self.start_colors
+        if self.target_colors is not None:
+            self.end_colors = chart.set_colors(self.target_colors).get_colors()
+            chart.set_colors(self.start_colors)
+
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        self.mobject.set_values(
+            self.start_values + (self.target_values - self.start_values) * alpha
+        )
+        self.mobject.set_colors(
+            self.start_colors + (self.end_colors - self.start_colors) * alpha
+        )
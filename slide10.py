@@ -13,6 +13,8 @@ from manim import (
 )
 
 from manim_presentation_template import DefaultSlide, SideNoteTex
+from vertexcover.graph import Graph as CoverGraph
+from vertexcover.solvers import covered_neighbors, greedy_cover
 
 
 # Vertex Cover Approximation
@@ -97,18 +99,14 @@ class Slide10(DefaultSlide):
         self.play(FadeIn(*vertex_dots))
         self.wait()
 
-        # Create the cover
-        cover = [0, 1, 2, 3, 4, 5]
-        non_cover_vertices = range(len(cover), len(vertices))
-
-        cover_neighbors = [
-            [1, 2, 3, 4, 5, 7, 12],
-            [5, 3, 11, 12, 13],
-            [4, 9, 10, 12],
-            [10, 11, 12],
-            [7, 8],
-            [6],
-        ]
+        # Create the cover with the greedy algorithm and remember the
+        # edges that each cover vertex covers first.
+        cover_graph = CoverGraph.from_edges(edges, len(vertices))
+        cover = greedy_cover(cover_graph)
+        cover_neighbors = dict(
+            zip(cover, covered_neighbors(cover_graph, cover))
+        )
+        non_cover_vertices = [v for v in vertices if v not in cover]
 
         def dot_and_edges(cover_vertex):
             cover_dot = Dot(
@@ -145,8 +143,10 @@ class Slide10(DefaultSlide):
                     FadeOut(edge, run_time=fade_out_time)
                     for edge in graph.remove_edges(
                         *[
-                            (cover_vertex, v)
+                            edge
                             for v in cover_neighbors[cover_vertex]
+                            for edge in ((cover_vertex, v), (v, cover_vertex))
+                            if edge in edges
                         ]  # type: ignore
                     )
                 ],
@@ -37,6 +37,15 @@ from manim_presentation_template import (
 class Slide13(DefaultSlide):
 
     def content(self):
+        # The sector rotation at the end can be rendered on its own, from the
+        # checkpoint before it (see `resume`).
+        variables = self.resume("sector-rotation")
+        if variables is None:
+            self.proof_steps()
+            variables = self.checkpoint_variables
+        self.sector_rotation(**variables)
+
+    def proof_steps(self):
         header = self.add_header("Analysis", with_click=False).shift(UP * 0.2)
 
         # Write the theorem.
@@ -656,6 +665,52 @@ class Slide13(DefaultSlide):
         )
         self.wait()
 
+        # The rest of the slide only needs these, see `sector_rotation`.
+        self.register(
+            all_non_empty_sectors=all_non_empty_sectors,
+            angle_arc=angle_arc,
+            angle_arc_label_center=angle_arc_label_center,
+            c0=c0,
+            c1=c1,
+            c2=c2,
+            disk=disk,
+            empty_sectors=empty_sectors,
+            greedy_disk=greedy_disk,
+            greedy_radius=greedy_radius,
+            greedy_scale_factor=greedy_scale_factor,
+            phi_tex=phi_tex,
+            sector_bars=sector_bars,
+            sector_width=sector_width,
+            special_dot=special_dot,
+            special_neighborhood=special_neighborhood,
+            special_sector=special_sector,
+            special_sector_index=special_sector_index,
+            t1=t1,
+        )
+        self.checkpoint("sector-rotation")
+
+    def sector_rotation(
+        self,
+        all_non_empty_sectors,
+        angle_arc,
+        angle_arc_label_center,
+        c0,
+        c1,
+        c2,
+        disk,
+        empty_sectors,
+        greedy_disk,
+        greedy_radius,
+        greedy_scale_factor,
+        phi_tex,
+        sector_bars,
+        sector_width,
+        special_dot,
+        special_neighborhood,
+        special_sector,
+        special_sector_index,
+        t1,
+    ):
         # Scale cells
         rotation_animations = []
         for index, bar in enumerate(sector_bars[:special_sector_index]):
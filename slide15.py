@@ -23,6 +23,7 @@ from hmanim import native
 from manim_presentation_template import DefaultSlide
 from mextensions.layout import Layout
 from mextensions.recolorablebarchart import RecolorableBarChart
+from vertexcover.dataset import bar_ratio, load_dataset
 
 
 # Summary
@@ -108,50 +109,16 @@ class Slide15(DefaultSlide):
         # derive a new algorithm which yielded better solutions in practice.
 
         r3 = SurroundingRectangle(r1, buff=0.0, color=WHITE).next_to(r1, DOWN)
+        # The ratios are measured by `vertexcover.experiment`. The ratio of
+        # dblp-cite (see `bar_ratio`) is much larger than the others, so its
+        # bar is replaced by a larger one (see `override_rect`).
+        networks = load_dataset("data/approximation-ratios.json")
         original_measures = [
-            ("ego-facebook", 1),
-            ("ego-gplus", 1),
-            ("munmun\\_twitter\\_social", 1),
-            ("as-caida20071105", 1.00162910670649),
-            ("bio-CE-LC", 1.0027027027027),
-            ("as20000102", 1.00285171102662),
-            ("bn-mouse-kasthuri\\_graph\\_v4", 1.00584795321637),
-            ("topology", 1.00307869924957),
-            ("com-dblp", 1.00180055653566),
-            ("as-22july06", 1.00181653042688),
-            ("ca-AstroPh", 1.0028305028305),
-            ("wordnet-words", 1.00412575788379),
-            ("youtube-links", 1.00816179775281),
-            ("com-youtube", 1.00820018415209),
-            ("youtube-u-growth", 1.00853867580887),
-            ("soc-Epinions1", 1.00628366247756),
-            ("flixster", 1.00212838855031),
-            ("ca-cit-HepTh", 1.00352519966951),
-            ("ca-cit-HepPh", 1.00380716277834),
-            ("moreno\\_names", 1.00682926829268),
-            ("com-amazon", 1.01074698404179),
-            ("as-skitter", 1.00954862266681),
-            ("web-Google", 1.0085407199019),
-            ("bio-yeast-protein-inter", 1.00638977635783),
-            ("moreno\\_propro", 1.00798722044728),
-            ("bio-CE-HT", 1.01593137254902),
-            ("petster-carnivore", 1.00750561034944),
-            ("digg-friends", 1.00865259130808),
-            ("petster-friendships-cat", 1.00926939639442),
-            ("loc-brightkite\\_edges", 1.01449673023277),
-            ("citeseer", 1.01507546960918),
-            ("loc-gowalla\\_edges", 1.01434304576002),
-            ("bio-DM-HT", 1.01691542288557),
-            ("advogato", 1.01315789473684),
-            ("bn-fly-drosophila\\_medulla\\_1", 1.01612903225806),
-            ("hyves", 1.00792126971875),
-            ("cfinder-google", 1.00831443688587),
-            ("petster-friendships-dog", 1.0145153446978),
-            ("livemocha", 1.01844474635595),
-            ("p2p-Gnutella31", 1.00974956987192),
-            ("petster-friendships-hamster", 1.01355013550136),
-            #             ("dblp-cite", 1.04859993562922)
-            ("dblp-cite", 1),
+            (
+                network["name"],
+                bar_ratio(network, "greedy_ratio"),
+            )
+            for network in networks
         ]
 
         original_values = [min(x - 1.0, 0.02) for (_, x) in original_measures]
@@ -185,49 +152,11 @@ class Slide15(DefaultSlide):
         chart_group = Group(chart, override_rect).scale(0.45).move_to(r3)
 
         improved_measures = [
-            ("ego-facebook", 1),
-            ("ego-gplus", 1),
-            ("munmun_twitter_social", 1),
-            ("as-caida20071105", 1),
-            ("bio-CE-LC", 1),
-            ("as20000102", 1),
-            ("bn-mouse-kasthuri_graph_v4", 1),
-            ("topology", 1.0001924187031),
-            ("com-dblp", 1.00020612431721),
-            ("as-22july06", 1.00060551014229),
-            ("ca-AstroPh", 1.0008325008325),
-            ("wordnet-words", 1.00105236722833),
-            ("youtube-links", 1.0014202247191),
-            ("com-youtube", 1.00142627597537),
-            ("youtube-u-growth", 1.00145465800062),
-            ("soc-Epinions1", 1.00148114901257),
-            ("flixster", 1.00153659270949),
-            ("ca-cit-HepTh", 1.00159735610025),
-            ("ca-cit-HepPh", 1.00163796538138),
-            ("moreno_names", 1.0019512195122),
-            ("com-amazon", 1.00200335765239),
-            ("as-skitter", 1.00247416014529),
-            ("web-Google", 1.00295462742552),
-            ("bio-yeast-protein-inter", 1.00319488817891),
-            ("moreno_propro", 1.00319488817891),
-            ("bio-CE-HT", 1.00367647058824),
-            ("petster-carnivore", 1.00398988116566),
-            ("digg-friends", 1.00404025957774),
-            ("petster-friendships-cat", 1.0051577743717),
-            ("loc-brightkite_edges", 1.00521333516257),
-            ("citeseer", 1.00554181889754),
-            ("loc-gowalla_edges", 1.00575859039206),
-            ("bio-DM-HT", 1.00597014925373),
-            ("advogato", 1.0068058076225),
-            ("bn-fly-drosophila_medulla_1", 1.00733137829912),
-            ("hyves", 1.00787302812485),
-            ("cfinder-google", 1.00806248425296),
-            ("petster-friendships-dog", 1.00835348428226),
-            ("livemocha", 1.0090266424114),
-            ("p2p-Gnutella31", 1.0091760657618),
-            ("petster-friendships-hamster", 1.00948509485095),
-            #             ("dblp-cite", 1.04441583521081),
-            ("dblp-cite", 1),
+            (
+                network["name"],
+                bar_ratio(network, "improved_greedy_ratio"),
+            )
+            for network in networks
         ]
         improved_values = [min(x - 1.0, 0.02) for (_, x) in improved_measures]
 
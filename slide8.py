@@ -16,6 +16,8 @@ from manim import (
 )
 
 from manim_presentation_template import ContentText, DefaultSlide, SideNoteText
+from vertexcover.graph import Graph as CoverGraph
+from vertexcover.solvers import covered_neighbors, greedy_cover
 
 
 # Vertex Cover
@@ -101,16 +103,13 @@ class Slide8(DefaultSlide):
         self.play(*[FadeIn(dot, run_time=0.1) for dot in vertex_dots])
         self.wait()
 
-        # Create the vertex cover
-        cover = [0, 1, 2, 3, 4, 5]
-        cover_neighbors = [
-            [1, 2, 3, 4, 5, 7, 12],
-            [5, 3, 11, 12, 13],
-            [4, 9, 10, 12],
-            [10, 11, 12],
-            [7, 8],
-            [6],
-        ]
+        # Create the vertex cover with the greedy algorithm and remember the
+        # edges that each cover vertex covers first.
+        cover_graph = CoverGraph.from_edges(edges, len(vertices))
+        cover = greedy_cover(cover_graph)
+        cover_neighbors = dict(
+            zip(cover, covered_neighbors(cover_graph, cover))
+        )
 
         def dot_and_edges(cover_vertex):
             cover_dot = Dot(
@@ -132,7 +131,7 @@ class Slide8(DefaultSlide):
             return cover_dot, neighbor_edges
 
         # Add the first node to the cover
-        dot0, edges0 = dot_and_edges(0)
+        dot0, edges0 = dot_and_edges(cover[0])
         self.play(Create(dot0))
         self.play(*[Create(edge) for edge in edges0])
         self.wait()
@@ -153,7 +152,7 @@ class Slide8(DefaultSlide):
 
         # We briefly mention that removing the cover leaves
         # the graph edgeless.
-        non_cover_vertices = range(len(cover), len(vertices))
+        non_cover_vertices = [v for v in vertices if v not in cover]
         non_cover_dots = [
             Dot(
                 layout[v],  # type: ignore
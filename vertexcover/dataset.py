@@ -0,0 +1,31 @@
+import json
+
+# The approximation ratios shown on the slides, see `vertexcover.experiment`.
+APPROXIMATION_RATIOS_PATH = "data/approximation-ratios.json"
+
+# The network whose ratios are much larger than those of the others. The
+# slides replace its bar by a larger one, which is labeled with its ratio.
+CLIPPED_NETWORK = "dblp-cite"
+
+
+def load_dataset(path=APPROXIMATION_RATIOS_PATH):
+    """The networks of a dataset, each as a dictionary with its `name` and
+    measurements such as its `greedy_ratio` and `improved_greedy_ratio`.
+    """
+    with open(path) as f:
+        return json.load(f)["networks"]
+
+
+def write_dataset(networks, path=APPROXIMATION_RATIOS_PATH):
+    # One network per line keeps the diffs of updated datasets readable.
+    with open(path, "w") as f:
+        f.write('{\n  "networks": [\n')
+        f.write(",\n".join("    " + json.dumps(network) for network in networks))
+        f.write("\n  ]\n}\n")
+
+
+def bar_ratio(network, key):
+    """The ratio `key` (e.g., `greedy_ratio`) of the `network` that its bar
+    shows, which is 1 (an empty bar) for the `CLIPPED_NETWORK`.
+    """
+    return 1 if network["name"] == CLIPPED_NETWORK else network[key]
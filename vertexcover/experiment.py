@@ -0,0 +1,176 @@
+"""Measures the approximation ratios of the greedy vertex cover algorithms.
+
+Every edge list in the given folder is solved with the standard greedy
+algorithm, the improved greedy algorithm and an exact solver, in parallel
+processes. When the exact solver exceeds the timeout (or the timeout is
+0), the ratios are computed with respect to the lower bound of the LP
+relaxation instead, and are thus upper bounds on the actual ratios. Results
+are cached by the hash of the graph and of the solver code, so only new or
+changed networks are solved again, unless the solvers changed. The ratios
+are written to the dataset that the slides show
+(`data/approximation-ratios.json`).
+
+Run from the repository root:
+
+    python -m vertexcover.experiment networks/ [--timeout 600]
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import hashlib
+import json
+import os
+import time
+
+import vertexcover.graph
+import vertexcover.lp
+import vertexcover.reductions
+import vertexcover.solvers
+from vertexcover.dataset import APPROXIMATION_RATIOS_PATH, write_dataset
+from vertexcover.graph import network_name, read_edge_list
+from vertexcover.lp import lp_lower_bound, lp_relaxation
+from vertexcover.solvers import (
+    SMALL_COMPONENT_SIZE,
+    exact_cover,
+    greedy_cover,
+    improved_greedy_cover,
+)
+
+EDGE_LIST_PATTERNS = ("*.txt", "*.edges", "*.tsv", "*.csv", "*.gz", "*.bz2", "*.xz")
+
+# The modules whose results are cached, see `solver_version`.
+SOLVER_MODULES = (
+    vertexcover.graph,
+    vertexcover.lp,
+    vertexcover.reductions,
+    vertexcover.solvers,
+)
+
+
+def edge_list_paths(folder):
+    """The edge list of each network in `folder`. A network that is stored
+    in several formats (e.g., `as-skitter.txt` and `as-skitter.txt.gz`) is
+    read from the first of `EDGE_LIST_PATTERNS`, such that every name occurs
+    once in the dataset.
+    """
+    paths = dict()
+    for pattern in EDGE_LIST_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(folder, pattern))):
+            paths.setdefault(network_name(path), path)
+
+    return sorted(paths.values())
+
+
+def solver_version():
+    """A hash of the source of the modules that compute the results (and of
+    this one), such that changes to the solvers invalidate cached results.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(module.__file__ for module in SOLVER_MODULES) + [__file__]:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def measure(path, timeout, small_size, cache_folder):
+    """Solves the network in the file at `path` and returns its entry of the
+    dataset.
+    """
+    graph = read_edge_list(path)
+    fingerprint = graph.fingerprint()
+    cache_path = os.path.join(
+        cache_folder,
+        "%s-%s-%s-%d.json" % (fingerprint, solver_version(), timeout, small_size),
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return dict(json.load(f), name=network_name(path))
+
+    start = time.perf_counter()
+    greedy = len(greedy_cover(graph))
+    upper_bound = improved_greedy_cover(graph, small_size)
+    improved_greedy = len(upper_bound)
+    optimum = None
+    if timeout > 0:
+        optimum = exact_cover(graph, timeout, upper_bound=upper_bound)
+    optimum = None if optimum is None else len(optimum)
+    if optimum is not None:
+        lower_bound = optimum
+    else:
+        lower_bound = lp_lower_bound(lp_relaxation(graph))
+
+    # Without edges, every algorithm finds the empty (optimal) cover.
+    def ratio(size):
+        return size / lower_bound if lower_bound else 1
+
+    network = dict(
+        name=network_name(path),
+        fingerprint=fingerprint,
+        vertices=graph.vertex_count,
+        edges=graph.edge_count,
+        greedy=greedy,
+        improved_greedy=improved_greedy,
+        optimum=optimum,
+        lower_bound=lower_bound,
+        greedy_ratio=ratio(greedy),
+        improved_greedy_ratio=ratio(improved_greedy),
+        time=time.perf_counter() - start,
+    )
+
+    os.makedirs(cache_folder, exist_ok=True)
+    temporary_path = "%s.%d.tmp" % (cache_path, os.getpid())
+    with open(temporary_path, "w") as f:
+        json.dump(network, f)
+    os.replace(temporary_path, cache_path)
+    return network
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", help="the folder with the edge lists")
+    parser.add_argument("--output", default=APPROXIMATION_RATIOS_PATH)
+    parser.add_argument("--cache-folder", default="./experiment-cache")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600.0,
+        help="the time (in seconds) the exact solver may take per network, 0 to"
+        " only compute bounds",
+    )
+    parser.add_argument("--small-size", type=int, default=SMALL_COMPONENT_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    paths = edge_list_paths(args.folder)
+    networks = list()
+    with concurrent.futures.ProcessPoolExecutor(args.workers) as executor:
+        futures = {
+            executor.submit(
+                measure, path, args.timeout, args.small_size, args.cache_folder
+            ): path
+            for path in paths
+        }
+        for future in concurrent.futures.as_completed(futures):
+            network = future.result()
+            networks.append(network)
+            print(
+                "%s: greedy %.5f, improved %.5f%s"
+                % (
+                    network["name"],
+                    network["greedy_ratio"],
+                    network["improved_greedy_ratio"],
+                    "" if network["optimum"] is not None else " (upper bounds)",
+                )
+            )
+
+    # The slides show the networks ordered by the ratio of the improved
+    # algorithm.
+    networks.sort(
+        key=lambda network: (network["improved_greedy_ratio"], network["name"])
+    )
+    write_dataset(networks, args.output)
+
+
+if __name__ == "__main__":
+    main()
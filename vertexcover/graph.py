@@ -0,0 +1,279 @@
+import bz2
+import gzip
+import hashlib
+import lzma
+import os
+
+import numpy as np
+
+# The approximate number of bytes of an edge list that are parsed at once.
+CHUNK_SIZE = 1 << 24
+
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+# Edges are stored as a single integer, with the smaller vertex in the upper
+# half, such that sorting them sorts by both vertices.
+EDGE_KEY_SHIFT = np.int64(32)
+EDGE_KEY_MASK = np.int64((1 << 32) - 1)
+
+
+class Graph:
+    """An undirected graph in compressed sparse row (CSR) format. The
+    neighbors of vertex `v` are `neighbors[offsets[v]:offsets[v + 1]]`,
+    sorted in increasing order. If the graph was read from a file, `ids`
+    holds the original id of each vertex.
+    """
+
+    def __init__(self, offsets, neighbors, ids=None):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.neighbors = np.asarray(neighbors)
+        self.ids = ids
+
+    @staticmethod
+    def from_edges(edges, vertex_count=None):
+        """Builds the graph with the `edges` (pairs of vertices in
+        `range(vertex_count)`), without self-loops and multi-edges.
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if vertex_count is None:
+            vertex_count = int(edges.max()) + 1 if len(edges) else 0
+
+        return Graph.from_edge_keys(unique(edge_keys(edges)), vertex_count)
+
+    @staticmethod
+    def from_edge_keys(keys, vertex_count):
+        """Builds the graph from the sorted and unique `keys` of its edges
+        (see `edge_keys`), using memory for little more than the result.
+        """
+        smaller = (keys >> EDGE_KEY_SHIFT).astype(index_type(vertex_count))
+        larger = (keys & EDGE_KEY_MASK).astype(smaller.dtype)
+        del keys
+
+        # The neighbors of each vertex are its smaller neighbors followed by
+        # its larger ones. The keys are sorted by the smaller vertex, so the
+        # larger neighbors of each vertex are already in order.
+        smaller_degrees = np.bincount(larger, minlength=vertex_count)
+        larger_degrees = np.bincount(smaller, minlength=vertex_count)
+        offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+        np.cumsum(smaller_degrees + larger_degrees, out=offsets[1:])
+        neighbors = np.empty(offsets[-1], dtype=smaller.dtype)
+
+        # The position of an edge in its group of equal vertices is its index
+        # minus the index where the group starts.
+        starts = np.cumsum(larger_degrees) - larger_degrees
+        ranks = np.arange(len(smaller)) - starts[smaller]
+        neighbors[offsets[smaller] + smaller_degrees[smaller] + ranks] = larger
+
+        # Sorting by the larger vertex (stably) orders the smaller neighbors.
+        order = np.argsort(larger, kind="stable")
+        smaller, larger = smaller[order], larger[order]
+        del order
+        starts = np.cumsum(smaller_degrees) - smaller_degrees
+        ranks = np.arange(len(larger)) - starts[larger]
+        neighbors[offsets[larger] + ranks] = smaller
+
+        return Graph(offsets, neighbors)
+
+    @property
+    def vertex_count(self):
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self):
+        return len(self.neighbors) // 2
+
+    def degrees(self):
+        return np.diff(self.offsets)
+
+    def neighbors_of(self, v):
+        return self.neighbors[self.offsets[v] : self.offsets[v + 1]]
+
+    def adjacencies(self):
+        """The neighbors of each vertex as a list of Python lists, which is
+        faster to traverse vertex by vertex than the arrays.
+        """
+        neighbors = self.neighbors.tolist()
+        offsets = self.offsets.tolist()
+        return [neighbors[offsets[v] : offsets[v + 1]] for v in range(len(offsets) - 1)]
+
+    def edges(self):
+        """Each edge `(u, v)` with `u < v`, as rows of an array."""
+        sources = np.repeat(np.arange(self.vertex_count), self.degrees())
+        mask = sources < self.neighbors
+        return np.stack([sources[mask], self.neighbors[mask]], axis=1)
+
+    def fingerprint(self):
+        """A hash of the structure of the graph, independent of the integer
+        types of its arrays.
+        """
+        digest = hashlib.sha256()
+        digest.update(self.offsets.astype(np.int64).tobytes())
+        for start in range(0, len(self.neighbors), CHUNK_SIZE):
+            chunk = self.neighbors[start : start + CHUNK_SIZE]
+            digest.update(chunk.astype(np.int64).tobytes())
+        return digest.hexdigest()
+
+    def is_vertex_cover(self, cover):
+        in_cover = np.zeros(self.vertex_count, dtype=bool)
+        in_cover[list(cover)] = True
+        edges = self.edges()
+        return bool(np.all(in_cover[edges[:, 0]] | in_cover[edges[:, 1]]))
+
+
+def index_type(count):
+    """The smallest integer type that can index `count` elements."""
+    return np.int32 if count < 2**31 else np.int64
+
+
+def edge_keys(edges):
+    """The keys of the `edges` (rows of vertex pairs) that are no self-loops,
+    see `EDGE_KEY_SHIFT`.
+    """
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    smaller = np.minimum(edges[:, 0], edges[:, 1]).astype(np.int64)
+    larger = np.maximum(edges[:, 0], edges[:, 1]).astype(np.int64)
+    return (smaller << EDGE_KEY_SHIFT) | larger
+
+
+def unique(keys):
+    """The sorted unique `keys`. Unlike `np.unique`, which hashes integers in
+    recent versions of numpy, this sorts them, which is much faster.
+    """
+    keys = np.sort(keys)
+    if len(keys) == 0:
+        return keys
+    keep = np.empty(len(keys), dtype=bool)
+    keep[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=keep[1:])
+    return keys[keep]
+
+
+def network_name(path):
+    """The name of the network in the file at `path`, i.e., the file name
+    without its extensions (e.g., `as-skitter` for `as-skitter.txt.gz`).
+    """
+    return os.path.basename(path).split(".")[0]
+
+
+def parse_edges(data):
+    """The first two columns of the edge list `data` (bytes) as an array of
+    vertex id pairs. Comments (starting with `#` or `%`) are skipped and the
+    columns may be separated by whitespace or commas.
+    """
+    data = data.replace(b",", b" ")
+    if b"#" in data or b"%" in data:
+        lines = data.split(b"\n")
+        data = b"\n".join(line for line in lines if line.lstrip()[:1] not in b"#%")
+    tokens = data.split()
+    if not tokens:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Most files have the same number of columns in every line, which allows
+    # parsing the chunk at once.
+    columns = len(data.lstrip().split(b"\n", 1)[0].split())
+    line_count = data.count(b"\n") + (not data.endswith(b"\n"))
+    if columns >= 2 and len(tokens) == columns * line_count:
+        sources, targets = tokens[0::columns], tokens[1::columns]
+    else:
+        pairs = [line.split()[:2] for line in data.splitlines() if line.strip()]
+        sources, targets = [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+
+    return np.stack(
+        [np.array(sources).astype(np.int64), np.array(targets).astype(np.int64)],
+        axis=1,
+    )
+
+
+def chunks(f, chunk_size):
+    """The contents of the binary file `f` in chunks of about `chunk_size`
+    bytes that end with a complete line.
+    """
+    rest = b""
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            break
+
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            rest += data
+            continue
+        yield rest + data[:end]
+        rest = data[end:]
+
+    if rest:
+        yield rest
+
+
+def read_edge_list(path, chunk_size=CHUNK_SIZE):
+    """Reads a graph from a file with one edge (two vertex ids, separated by
+    whitespace or a comma, possibly followed by further columns) per line,
+    such as `hrg.txt` or the SNAP and KONECT formats. The file may be
+    compressed (`.gz`, `.bz2`, `.xz`).
+
+    The file is read in chunks of about `chunk_size` bytes, whose edges are
+    deduplicated right away and merged with those of earlier chunks whenever
+    they outnumber them, so besides the graph only a small multiple of its
+    unique edges is kept in memory. The vertex ids are mapped to `range(n)`
+    in sorted order, self-loops and multi-edges are removed.
+    """
+    opener = OPENERS.get(os.path.splitext(path)[1], open)
+
+    # The ids seen so far, sorted, and their dense indices, which are given in
+    # the order in which the ids appear.
+    known_ids = np.empty(0, dtype=np.int64)
+    known_indices = np.empty(0, dtype=np.int64)
+
+    # The sorted unique keys of the merged chunks and the keys of the chunks
+    # read since, which may repeat edges of other chunks.
+    merged_keys = np.empty(0, dtype=np.int64)
+    chunk_keys = list()
+    chunk_key_count = 0
+    with opener(path, "rb") as f:
+        for data in chunks(f, chunk_size):
+            edges = parse_edges(data)
+            del data
+            ids, inverse = np.unique(edges, return_inverse=True)
+            positions = np.searchsorted(known_ids, ids)
+            found = positions < len(known_ids)
+            found[found] = known_ids[positions[found]] == ids[found]
+
+            indices = np.empty(len(ids), dtype=np.int64)
+            indices[found] = known_indices[positions[found]]
+            new = ~found
+            indices[new] = np.arange(len(known_ids), len(known_ids) + new.sum())
+            known_ids = np.insert(known_ids, positions[new], ids[new])
+            known_indices = np.insert(known_indices, positions[new], indices[new])
+
+            edges = indices[inverse.reshape(-1)].reshape(-1, 2)
+            chunk_keys.append(unique(edge_keys(edges)))
+            chunk_key_count += len(chunk_keys[-1])
+            if chunk_key_count > len(merged_keys):
+                merged_keys = unique(np.concatenate([merged_keys, *chunk_keys]))
+                chunk_keys, chunk_key_count = list(), 0
+
+    # The vertices are renumbered in the order of their ids, such that files
+    # whose ids are already dense keep them.
+    ranks = np.empty_like(known_indices)
+    ranks[known_indices] = np.arange(len(known_indices))
+    del known_indices
+
+    keys = np.concatenate([merged_keys, *chunk_keys])
+    del merged_keys, chunk_keys
+    smaller = ranks[keys >> EDGE_KEY_SHIFT]
+    larger = ranks[keys & EDGE_KEY_MASK]
+    keys = (np.minimum(smaller, larger) << EDGE_KEY_SHIFT) | np.maximum(smaller, larger)
+    del smaller, larger
+
+    graph = Graph.from_edge_keys(unique(keys), len(known_ids))
+    graph.ids = known_ids
+    return graph
+
+
+def read_coordinates(path):
+    """The radii and azimuths of the vertices of a hyperbolic random graph,
+    from a file with the polar coordinates of vertex `i` in line `i`, such
+    as `hrg.hyp`.
+    """
+    coordinates = np.loadtxt(path, ndmin=2)
+    return coordinates[:, 0], coordinates[:, 1]
@@ -0,0 +1,140 @@
+"""The LP relaxation of vertex cover, which bounds the size of a minimum
+vertex cover from below without solving the problem exactly.
+
+The relaxation has an optimal solution in which every vertex has the value
+0, 1/2 or 1. It is found with a maximum matching of the bipartite double
+cover, which has a left and a right copy of every vertex and, for every
+edge `{u, v}`, the edges from the left copy of `u` to the right copy of `v`
+and vice versa. By König's theorem, a minimum vertex cover of the double
+cover has as many vertices as the matching, and each vertex gets half the
+number of its copies in it (Nemhauser and Trotter, 1975).
+
+The adjacency matrix of a graph is the biadjacency matrix of its double
+cover, so the CSR arrays of the graph describe the double cover as well.
+"""
+
+import itertools
+import math
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.csgraph
+
+
+def csr_arrays(adjacencies):
+    """The offsets and neighbors (see `vertexcover.graph.Graph`) of the
+    graph given by its `adjacencies` (a list of neighbor collections).
+    """
+    offsets = np.zeros(len(adjacencies) + 1, dtype=np.int64)
+    np.cumsum([len(neighbors) for neighbors in adjacencies], out=offsets[1:])
+    neighbors = np.fromiter(
+        itertools.chain.from_iterable(adjacencies), dtype=np.int64, count=offsets[-1]
+    )
+    return offsets, neighbors
+
+
+def maximum_matching(offsets, neighbors, right_count=None):
+    """A maximum matching of the bipartite graph in which the left vertex `v`
+    is adjacent to the right vertices `neighbors[offsets[v]:offsets[v + 1]]`,
+    such as the double cover of a graph (see above), as the right vertices
+    that the left ones are matched to and vice versa (-1 for unmatched
+    vertices). It is found with the algorithm of Hopcroft and Karp.
+    """
+    left_count = len(offsets) - 1
+    if right_count is None:
+        right_count = left_count
+    biadjacency = scipy.sparse.csr_array(
+        (np.ones(len(neighbors), dtype=np.int8), neighbors, offsets),
+        shape=(left_count, right_count),
+    )
+    left_mates = scipy.sparse.csgraph.maximum_bipartite_matching(
+        biadjacency, perm_type="column"
+    ).astype(np.int64)
+    right_mates = np.full(right_count, -1, dtype=np.int64)
+    matched = np.flatnonzero(left_mates != -1)
+    right_mates[left_mates[matched]] = matched
+    return left_mates, right_mates
+
+
+def alternating_reach(offsets, neighbors, right_mates, starts):
+    """The left and right vertices (as boolean arrays) that are reachable
+    from the left vertices `starts` by alternating paths, which leave left
+    vertices by any edge and right vertices by their matching edge, for a
+    maximum matching given by `right_mates`.
+    """
+    left_count, right_count = len(offsets) - 1, len(right_mates)
+
+    # From each left vertex, the alternating paths continue at the mates of
+    # its neighbors. A maximum matching has no augmenting paths, so only left
+    # vertices that cannot be reached have unmatched neighbors, which lead to
+    # the extra vertex `left_count`. Another extra vertex leads to `starts`.
+    successors = right_mates[neighbors]
+    successors[successors == -1] = left_count
+    source = left_count + 1
+    starts = np.asarray(starts, dtype=np.int64)
+    directed = scipy.sparse.csr_array(
+        (
+            np.ones(len(successors) + len(starts), dtype=np.int8),
+            np.concatenate([successors, starts]),
+            np.concatenate([offsets, [offsets[-1], offsets[-1] + len(starts)]]),
+        ),
+        shape=(left_count + 2, left_count + 2),
+    )
+    order = scipy.sparse.csgraph.breadth_first_order(
+        directed, source, return_predecessors=False
+    )
+
+    reached_left = np.zeros(left_count + 2, dtype=bool)
+    reached_left[order] = True
+    reached_left = reached_left[:left_count]
+    reached_right = np.zeros(right_count, dtype=bool)
+    reached_right[neighbors[np.repeat(reached_left, np.diff(offsets))]] = True
+    return reached_left, reached_right
+
+
+def half_integral_solution(offsets, neighbors, left_mates, right_mates):
+    """The optimal solution of the LP relaxation (as an array with twice the
+    value of each vertex) for the maximum matching `left_mates` and
+    `right_mates` of the double cover.
+    """
+    # The right copies reachable from unmatched left copies and the other
+    # left ones form a minimum vertex cover of the double cover.
+    reached_left, reached_right = alternating_reach(
+        offsets, neighbors, right_mates, np.flatnonzero(left_mates == -1)
+    )
+    return (~reached_left).astype(np.int8) + reached_right
+
+
+def lp_relaxation(graph):
+    """An optimal half-integral solution of the LP relaxation of vertex cover
+    for the CSR `graph`, as an array with twice the value of each vertex
+    (0, 1 or 2).
+    """
+    offsets, neighbors = graph.offsets, graph.neighbors.astype(np.int64)
+    left_mates, right_mates = maximum_matching(offsets, neighbors)
+    return half_integral_solution(offsets, neighbors, left_mates, right_mates)
+
+
+def lp_solution(adjacencies):
+    """Like `lp_relaxation`, as a list, for the graph given by its
+    `adjacencies` (a list of neighbor collections).
+    """
+    offsets, neighbors = csr_arrays(adjacencies)
+    left_mates, right_mates = maximum_matching(offsets, neighbors)
+    return half_integral_solution(offsets, neighbors, left_mates, right_mates).tolist()
+
+
+def lp_lower_bound(solution):
+    """The lower bound on the size of a vertex cover that the `solution` of
+    `lp_relaxation` gives.
+    """
+    return math.ceil(int(np.sum(solution, dtype=np.int64)) / 2)
+
+
+def persistent_vertices(solution):
+    """The vertices with value 1 and 0 in the `solution` of `lp_relaxation`.
+    Some minimum vertex cover contains all of the former and none of the
+    latter (Nemhauser and Trotter, 1975).
+    """
+    solution = np.asarray(solution)
+    return np.flatnonzero(solution == 2), np.flatnonzero(solution == 0)
@@ -0,0 +1,226 @@
+"""Exact vertex covers of the outer band of hyperbolic random graphs.
+
+Outside of a disk around the center, the vertices of a hyperbolic random
+graph are only adjacent to vertices of similar azimuth. Sweeping them by
+azimuth thus gives a path decomposition of small width, over which a
+dynamic program finds a minimum vertex cover in time linear in the number
+of vertices and exponential only in the width (Bläsius, Fischbeck,
+Friedrich and Katzmann, STACS 2020).
+
+Run from the repository root:
+
+    python -m vertexcover.pathwidth hrg-large.txt hrg-large.hyp --radius 10
+"""
+
+import argparse
+import collections
+import itertools
+import math
+import time
+
+import numpy as np
+
+from vertexcover.graph import Graph, read_coordinates, read_edge_list
+from vertexcover.solvers import exact_cover_of
+
+# The largest width for which the dynamic program is used. Its tables have
+# 2^(width + 1) entries, and every forgotten vertex keeps 2^width bits for
+# reconstructing the cover, so this bounds the memory by about 16 MB per
+# table and 128 KB per vertex.
+MAX_WIDTH = 20
+
+
+def sweep_order(vertices, azimuths):
+    """The `vertices` sorted by azimuth, starting after the largest angular
+    gap between two of them, such that the sweep does not start within a
+    dense part of the band.
+    """
+    vertices = sorted(vertices, key=lambda v: azimuths[v])
+    angles = [azimuths[v] for v in vertices]
+    gaps = [b - a for a, b in zip(angles, angles[1:])]
+    gaps.append(angles[0] + 2 * math.pi - angles[-1])
+    start = (gaps.index(max(gaps)) + 1) % len(vertices)
+    return vertices[start:] + vertices[:start]
+
+
+def last_positions(adjacencies, order):
+    """The position in `order` of the last neighbor (or the vertex itself)
+    of each vertex, after which it leaves the bags.
+    """
+    positions = {v: i for i, v in enumerate(order)}
+    return {
+        v: max([i] + [positions[u] for u in adjacencies[v] if u in positions])
+        for i, v in enumerate(order)
+    }
+
+
+def bag_sizes(adjacencies, order):
+    """The sizes of the bags of the path decomposition given by `order`. Bag
+    `i` contains `order[i]` and the earlier vertices with a neighbor at `i`
+    or later, so the width of the decomposition is the largest size minus
+    one.
+    """
+    last = last_positions(adjacencies, order)
+    changes = [0] * (len(order) + 1)
+    for i, v in enumerate(order):
+        changes[i] += 1
+        changes[last[v] + 1] -= 1
+
+    return list(itertools.accumulate(changes[:-1]))
+
+
+def path_decomposition_cover(adjacencies, order, max_width=MAX_WIDTH):
+    """A minimum vertex cover of the graph induced by `order`, or None if the
+    path decomposition given by `order` (see `bag_sizes`) is wider than
+    `max_width`.
+
+    The table of each bag holds, for each subset of the bag (as a bitmask
+    over the positions in `bag`), the size of a minimum cover of the graph
+    swept so far that contains exactly this subset of the bag. Only the
+    choices made when vertices leave the bag are kept, from which the cover
+    is reconstructed backwards.
+    """
+    last = last_positions(adjacencies, order)
+    leaving = collections.defaultdict(list)
+    for v, i in last.items():
+        leaving[i].append(v)
+
+    infinity = len(order) + 1
+    costs = np.zeros(1, dtype=np.int32)
+    bag = list()
+
+    # `(v, choices, bit)`: `v` entered the bag at `bit` if `choices` is None,
+    # otherwise it left the bag from `bit`, and `choices` says for each
+    # subset of the remaining bag whether `v` is in its best cover.
+    steps = list()
+    for i, v in enumerate(order):
+        if len(bag) > max_width:
+            return None
+
+        # `v` may only be left out if its neighbors in the bag are taken.
+        neighbors = 0
+        for bit, u in enumerate(bag):
+            if u in adjacencies[v]:
+                neighbors |= 1 << bit
+        masks = np.arange(len(costs))
+        without = np.where(masks & neighbors == neighbors, costs, infinity)
+        costs = np.concatenate([without, costs + 1])
+        steps.append((v, None, len(bag)))
+        bag.append(v)
+
+        for u in leaving[i]:
+            bit = bag.index(u)
+            pairs = costs.reshape(-1, 2, 1 << bit)
+            choices = pairs[:, 1, :] < pairs[:, 0, :]
+            costs = np.where(choices, pairs[:, 1, :], pairs[:, 0, :]).reshape(-1)
+            steps.append((u, np.packbits(choices.reshape(-1)), bit))
+            bag.pop(bit)
+
+    cover = list()
+    mask = 0
+    for v, choices, bit in reversed(steps):
+        if choices is None:
+            if mask >> bit & 1:
+                cover.append(v)
+            mask &= ~(1 << bit)
+        else:
+            taken = int(choices[mask >> 3]) >> (7 - (mask & 7)) & 1
+            low = mask & ((1 << bit) - 1)
+            mask = (mask >> bit) << (bit + 1) | taken << bit | low
+
+    return cover
+
+
+def outer_band_cover(graph, radii, azimuths, radius, max_width=MAX_WIDTH):
+    """A minimum vertex cover of the subgraph induced by the vertices with at
+    least the given `radius` (`radii` and `azimuths` hold the coordinates of
+    the vertices of `graph`). Each component is solved by the dynamic
+    program over its sweep, or by branch and reduce if it is too wide.
+
+    Returns the cover and, for each component with edges, a dictionary with
+    its number of `vertices`, the `width` of its decomposition and whether
+    it was `swept`.
+    """
+    in_band = [r >= radius for r in radii.tolist()]
+    adjacencies = {
+        v: {u for u in neighbors if in_band[u]}
+        for v, neighbors in enumerate(graph.adjacencies())
+        if in_band[v]
+    }
+
+    cover = list()
+    components = list()
+    seen = set()
+    for start in adjacencies:
+        if start in seen or not adjacencies[start]:
+            continue
+
+        component = [start]
+        seen.add(start)
+        for v in component:
+            for u in adjacencies[v]:
+                if u not in seen:
+                    seen.add(u)
+                    component.append(u)
+
+        order = sweep_order(component, azimuths)
+        width = max(bag_sizes(adjacencies, order)) - 1
+        component_cover = None
+        if width <= max_width:
+            component_cover = path_decomposition_cover(adjacencies, order, max_width)
+        if component_cover is None:
+            component_cover = exact_cover_of({v: adjacencies[v] for v in component})
+
+        cover.extend(component_cover)
+        components.append(
+            dict(vertices=len(component), width=width, swept=width <= max_width)
+        )
+
+    return cover, components
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("edge_list", help="the edge list of the graph")
+    parser.add_argument("coordinates", help="the coordinates of the vertices")
+    parser.add_argument(
+        "--radius", type=float, default=10.0, help="the inner radius of the band"
+    )
+    parser.add_argument("--max-width", type=int, default=MAX_WIDTH)
+    args = parser.parse_args()
+
+    # As in `vertexcover.radius_sweep`, the graph has a vertex for every line
+    # of the coordinates, including those without edges.
+    radii, azimuths = read_coordinates(args.coordinates)
+    edges = read_edge_list(args.edge_list)
+    graph = Graph.from_edges(edges.ids[edges.edges()], len(radii))
+    del edges
+
+    start = time.perf_counter()
+    cover, components = outer_band_cover(
+        graph, radii, azimuths, args.radius, args.max_width
+    )
+
+    # The vertices of the band without edges within it are components of
+    # their own, which no cover needs.
+    band_size = int(np.sum(radii >= args.radius))
+    isolated = band_size - sum(component["vertices"] for component in components)
+    print(
+        "%d vertices in the band, %d components with edges, %d vertices without"
+        " edges" % (band_size, len(components), isolated)
+    )
+    widths = collections.Counter(component["width"] for component in components)
+    for width, count in sorted(widths.items()):
+        print("width %d: %d components" % (width, count))
+    print(
+        "cover of %d vertices in %.2fs, %d components solved by branching"
+        % (
+            len(cover),
+            time.perf_counter() - start,
+            sum(not component["swept"] for component in components),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
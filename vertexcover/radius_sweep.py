@@ -0,0 +1,196 @@
+"""The components outside of disks around the center of a hyperbolic random
+graph, for choosing the radius of the disk whose vertices the greedy
+algorithm takes (slide 13).
+
+The vertices are added from the outside in, so that after the vertices
+with radius at least `ρ` have been added, the components of the added
+vertices are the components outside of the disk of radius `ρ`. A union-find
+structure tracks them, which gives the components for every radius in a
+single pass in O(m α(n)) time, instead of a search for every radius.
+
+Run from the repository root:
+
+    python -m vertexcover.radius_sweep hrg-large.txt hrg-large.hyp --small-size 4
+"""
+
+import argparse
+import collections
+
+import numpy as np
+
+from vertexcover.graph import Graph, read_coordinates, read_edge_list
+from vertexcover.solvers import SMALL_COMPONENT_SIZE
+
+
+class UnionFind:
+    """Disjoint sets of `range(n)`, merged by size with path halving."""
+
+    def __init__(self, n):
+        self.parents = list(range(n))
+        self.sizes = [1] * n
+
+    def find(self, v):
+        parents = self.parents
+        while parents[v] != v:
+            parents[v] = parents[parents[v]]
+            v = parents[v]
+        return v
+
+    def union(self, u, v):
+        """Merges the sets of `u` and `v`, and returns their sizes before, or
+        None if they are the same set.
+        """
+        u, v = self.find(u), self.find(v)
+        if u == v:
+            return None
+
+        sizes = self.sizes[u], self.sizes[v]
+        if sizes[0] < sizes[1]:
+            u, v = v, u
+        self.parents[v] = u
+        self.sizes[u] = sizes[0] + sizes[1]
+        return sizes
+
+
+def component_sweep(graph, radii, small_size=SMALL_COMPONENT_SIZE):
+    """Adds the vertices of the CSR `graph` from the largest radius in
+    `radii` to the smallest. Whenever all vertices with radius `ρ` have been
+    added, yields a dictionary with
+
+    - `radius`: `ρ`,
+    - `inside`: the number of vertices with a smaller radius,
+    - `components`: the number of components of the vertices outside,
+    - `largest`: the number of vertices of the largest one,
+    - `large`: the number of vertices in components with more than
+      `small_size` vertices,
+    - `sizes`: the numbers of components by their size, as a Counter.
+
+    The dictionary and the Counter are updated in place for the next
+    radius, so they have to be copied to be kept.
+    """
+    n = graph.vertex_count
+    order = np.argsort(-np.asarray(radii), kind="stable").tolist()
+    radii = np.asarray(radii).tolist()
+    adjacencies = graph.adjacencies()
+    added = [False] * n
+    components = UnionFind(n)
+    sizes = collections.Counter()
+    step = dict(radius=None, inside=n, components=0, largest=0, large=0, sizes=sizes)
+
+    def large_size(size):
+        return size if size > small_size else 0
+
+    for i, v in enumerate(order):
+        added[v] = True
+        sizes[1] += 1
+        step["inside"] -= 1
+        step["components"] += 1
+        step["largest"] = max(step["largest"], 1)
+        step["large"] += large_size(1)
+        for u in adjacencies[v]:
+            if not added[u]:
+                continue
+            merged = components.union(u, v)
+            if merged is None:
+                continue
+
+            size = merged[0] + merged[1]
+            for part in merged:
+                sizes[part] -= 1
+                if not sizes[part]:
+                    del sizes[part]
+                step["large"] -= large_size(part)
+            sizes[size] += 1
+            step["components"] -= 1
+            step["largest"] = max(step["largest"], size)
+            step["large"] += large_size(size)
+
+        if i + 1 == n or radii[order[i + 1]] != radii[v]:
+            step["radius"] = radii[v]
+            yield step
+
+
+def radius_profile(graph, radii, small_size=SMALL_COMPONENT_SIZE):
+    """The steps of `component_sweep` for every radius, without the
+    distributions of the sizes of the components.
+    """
+    return [
+        {key: value for key, value in step.items() if key != "sizes"}
+        for step in component_sweep(graph, radii, small_size)
+    ]
+
+
+def component_sizes(graph, radii, radius):
+    """The numbers of components outside of the disk of the given `radius`
+    by their size, as a Counter.
+    """
+    sizes = collections.Counter()
+    for step in component_sweep(graph, radii):
+        if step["radius"] < radius:
+            break
+        sizes = collections.Counter(step["sizes"])
+
+    return sizes
+
+
+def choose_radius(profile):
+    """The step of the `profile` with the fewest vertices that are either
+    inside the disk or in a large component outside of it, which are the
+    vertices for which the greedy algorithm is not known to be optimal.
+    Among equally good radii, the largest one is chosen.
+    """
+    return min(profile, key=lambda step: step["inside"] + step["large"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("edge_list", help="the edge list of the graph")
+    parser.add_argument("coordinates", help="the coordinates of the vertices")
+    parser.add_argument("--small-size", type=int, default=SMALL_COMPONENT_SIZE)
+    parser.add_argument(
+        "--step", type=float, default=0.5, help="the distance of the shown radii"
+    )
+    args = parser.parse_args()
+
+    # The edge list lacks the vertices without edges, which are in the disks
+    # and components as well, so the graph has a vertex for every line of the
+    # coordinates, numbered by the ids of the edge list.
+    radii, _ = read_coordinates(args.coordinates)
+    edges = read_edge_list(args.edge_list)
+    graph = Graph.from_edges(edges.ids[edges.edges()], len(radii))
+    del edges
+    profile = radius_profile(graph, radii, args.small_size)
+
+    # The disk of each shown radius is described by the last step with at
+    # least this radius.
+    print("radius  inside  components  largest  large")
+    step_radii = -np.array([step["radius"] for step in profile])
+    shown = np.arange(np.floor(profile[0]["radius"]), profile[-1]["radius"], -args.step)
+    for radius in shown:
+        step = profile[np.searchsorted(step_radii, -radius, side="right") - 1]
+        print(
+            "%6.2f  %6d  %10d  %7d  %5d"
+            % (
+                radius,
+                step["inside"],
+                step["components"],
+                step["largest"],
+                step["large"],
+            )
+        )
+
+    best = choose_radius(profile)
+    print(
+        "best radius %.3f: %d vertices inside, %d in components with more than"
+        " %d vertices"
+        % (best["radius"], best["inside"], best["large"], args.small_size)
+    )
+    sizes = component_sizes(graph, radii, best["radius"])
+    print(
+        "component sizes: "
+        + ", ".join("%d x %d" % (count, size) for size, count in sorted(sizes.items()))
+    )
+
+
+if __name__ == "__main__":
+    main()
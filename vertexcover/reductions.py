@@ -0,0 +1,467 @@
+"""Reduction rules for vertex cover, which take vertices that some minimum
+vertex cover contains and thereby shrink the graph.
+
+Run from the repository root to see how far a network shrinks (with
+`--dominance-only`, only by the dominance rule):
+
+    python -m vertexcover.reductions networks/as-skitter.txt.gz
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from vertexcover.graph import read_edge_list
+from vertexcover.lp import alternating_reach, csr_arrays, lp_solution, maximum_matching
+
+# The number of low degree reductions between checks of the deadline.
+DEADLINE_INTERVAL = 1024
+
+
+class Timeout(Exception):
+    pass
+
+
+class ReducibleGraph:
+    """A graph from which vertices can be removed and to which vertices can
+    be added. The neighbors of each vertex are a set, such that removing
+    vertices and comparing neighborhoods is cheap. The vertices whose
+    neighborhood changed are collected in `touched`, which the reductions
+    use to only recheck those.
+    """
+
+    def __init__(self, adjacencies):
+        self.adjacencies = adjacencies
+        self.removed = [False] * len(adjacencies)
+        self.vertex_count = len(adjacencies)
+        self.edge_count = sum(len(neighbors) for neighbors in adjacencies) // 2
+        self.touched = set()
+
+    @staticmethod
+    def from_graph(graph):
+        return ReducibleGraph([set(neighbors) for neighbors in graph.adjacencies()])
+
+    def copy(self):
+        graph = ReducibleGraph([set(neighbors) for neighbors in self.adjacencies])
+        graph.removed = list(self.removed)
+        graph.vertex_count = self.vertex_count
+        return graph
+
+    def subgraph(self, vertices):
+        """The subgraph induced by `vertices`, whose vertex `i` is
+        `vertices[i]`.
+        """
+        indices = {v: i for i, v in enumerate(vertices)}
+        return ReducibleGraph(
+            [
+                {indices[u] for u in self.adjacencies[v] if u in indices}
+                for v in vertices
+            ]
+        )
+
+    def degree(self, v):
+        return len(self.adjacencies[v])
+
+    def vertices(self):
+        return [v for v, removed in enumerate(self.removed) if not removed]
+
+    def components(self):
+        seen = set()
+        for start in self.vertices():
+            if start in seen:
+                continue
+
+            component = [start]
+            seen.add(start)
+            for v in component:
+                for u in self.adjacencies[v]:
+                    if u not in seen:
+                        seen.add(u)
+                        component.append(u)
+            yield component
+
+    def remove(self, v):
+        """Removes `v` and its edges and returns its former neighbors."""
+        neighbors = self.adjacencies[v]
+        for u in neighbors:
+            self.adjacencies[u].discard(v)
+
+        self.adjacencies[v] = set()
+        self.removed[v] = True
+        self.vertex_count -= 1
+        self.edge_count -= len(neighbors)
+        self.touched.update(neighbors)
+        return neighbors
+
+    def add_vertex(self, neighbors):
+        """Adds a vertex adjacent to `neighbors` and returns it."""
+        v = len(self.adjacencies)
+        for u in neighbors:
+            self.adjacencies[u].add(v)
+
+        self.adjacencies.append(set(neighbors))
+        self.removed.append(False)
+        self.vertex_count += 1
+        self.edge_count += len(neighbors)
+        self.touched.update(neighbors)
+        self.touched.add(v)
+        return v
+
+
+def dominating_neighbor(graph, v):
+    """A neighbor `u` of `v` that dominates it (`N[v]` is a subset of
+    `N[u]`), or None if there is none. Some minimum vertex cover contains
+    `u` (Garfinkel and Nemhauser, 1972).
+    """
+    adjacencies = graph.adjacencies
+    neighbors = adjacencies[v]
+    degree = len(neighbors)
+    if degree == 1:
+        return next(iter(neighbors))
+
+    # Only neighbors of at least the same degree can dominate `v`, and those
+    # of higher degree are more likely to.
+    candidates = [u for u in neighbors if len(adjacencies[u]) >= degree]
+    candidates.sort(key=lambda u: len(adjacencies[u]), reverse=True)
+    for u in candidates:
+        # The subset test stops at the first neighbor of `v` that `u` lacks.
+        neighbors.discard(u)
+        dominates = neighbors <= adjacencies[u]
+        neighbors.add(u)
+        if dominates:
+            return u
+
+    return None
+
+
+def reduce_dominance(graph, vertices=None):
+    """Takes dominating vertices (see `dominating_neighbor`) and removes them
+    from `graph` until no vertex is dominated. Only `vertices` (by default,
+    all) are checked at first; afterwards, only the neighbors of taken
+    vertices can have become dominated.
+
+    Vertices without edges are removed as well. Returns the taken vertices
+    and, for each round (one pass over the vertices to check), a dictionary
+    with its number of `reductions`, its `time` in seconds and the size of
+    the remaining graph.
+    """
+    worklist = set(graph.vertices() if vertices is None else vertices)
+    cover = list()
+    rounds = list()
+    while worklist:
+        start = time.perf_counter()
+        reductions = 0
+        pending, worklist = sorted(worklist), set()
+        for v in pending:
+            if graph.removed[v]:
+                continue
+            if graph.degree(v) == 0:
+                graph.remove(v)
+                continue
+
+            u = dominating_neighbor(graph, v)
+            if u is not None:
+                cover.append(u)
+                worklist.update(graph.remove(u))
+                reductions += 1
+
+        rounds.append(
+            dict(
+                reductions=reductions,
+                time=time.perf_counter() - start,
+                vertices=graph.vertex_count,
+                edges=graph.edge_count,
+            )
+        )
+
+    return cover, rounds
+
+
+def find_crown(graph):
+    """A crown of `graph`, i.e., an independent set `I` and its neighborhood
+    `H = N(I)`, such that the edges between them have a matching that covers
+    `H`, or None if no crown is found. Some minimum vertex cover contains
+    `H` and no vertex of `I` (Chor, Fellows and Juedes, 2004).
+    """
+    adjacencies = graph.adjacencies
+
+    # The vertices that a maximal matching leaves unmatched are independent.
+    matched = set()
+    for v in graph.vertices():
+        if v not in matched:
+            u = next((u for u in adjacencies[v] if u not in matched), None)
+            if u is not None:
+                matched.update((u, v))
+    outsiders = [v for v in graph.vertices() if v not in matched]
+
+    # The outsiders that a maximum matching into their neighborhood leaves
+    # unmatched, together with the vertices reachable from them along
+    # alternating paths, form the crown.
+    bipartite = [set() for _ in adjacencies]
+    for v in outsiders:
+        bipartite[v] = adjacencies[v]
+    offsets, neighbors = csr_arrays(bipartite)
+    mates, right_mates = maximum_matching(offsets, neighbors)
+    unmatched = [v for v in outsiders if mates[v] == -1]
+    if not unmatched:
+        return None
+
+    crown, head = alternating_reach(offsets, neighbors, right_mates, unmatched)
+    crown = set(np.flatnonzero(crown).tolist())
+    head = set(np.flatnonzero(head).tolist())
+    return crown, head
+
+
+class Kernel:
+    """The kernel of a graph, i.e., what remains after applying reduction
+    rules exhaustively, together with what is needed to lift a vertex cover
+    of the kernel to one of the graph:
+
+    - vertices without edges are removed,
+    - the neighbor of a vertex of degree one is taken,
+    - a vertex `v` of degree two is folded: if its neighbors `a` and `b` are
+      adjacent, both are taken, otherwise the three vertices are replaced by
+      a new vertex adjacent to the neighbors of `a` and `b`, which is in a
+      minimum cover of the reduced graph if and only if `a` and `b` are in
+      one of the graph (and otherwise `v` is),
+    - dominating vertices are taken (see `dominating_neighbor`),
+    - the vertices with value 1 in an optimal solution of the LP relaxation
+      are taken and those with value 0 removed (see `vertexcover.lp`),
+    - the heads of crowns are taken and the crowns removed (see
+      `find_crown`).
+
+    The rules are applied to `graph` (a `ReducibleGraph`, which becomes the
+    kernel), at first only to `vertices` (by default, all) and afterwards to
+    the vertices whose neighborhood changed. The cheap rules are applied
+    until they no longer change the graph, the LP relaxation and crowns are
+    only used afterwards.
+    """
+
+    def __init__(self, graph, vertices=None, deadline=None):
+        self.graph = graph
+        self.taken = list()
+
+        # The time (of `time.monotonic`) after which reducing raises
+        # `Timeout`, checked before each rule and during the low degree
+        # rules.
+        self.deadline = deadline
+
+        # The folded vertices `(v, a, b, folded)`, in the order in which they
+        # were folded, which lifting undoes in reverse.
+        self.folds = list()
+        self.rounds = list()
+        self.reduce(graph.vertices() if vertices is None else vertices)
+
+    @property
+    def offset(self):
+        """The number of vertices that any lifted cover has in addition to
+        those of the kernel cover.
+        """
+        return len(self.taken) + len(self.folds)
+
+    def adjacencies(self):
+        """The kernel as a dictionary of neighbor sets."""
+        return {v: set(self.graph.adjacencies[v]) for v in self.graph.vertices()}
+
+    def lift(self, cover):
+        """The vertex cover of the graph for the `cover` of the kernel. It is
+        minimum if `cover` is.
+        """
+        cover = set(cover)
+        cover.update(self.taken)
+        for v, a, b, folded in reversed(self.folds):
+            if folded in cover:
+                cover.remove(folded)
+                cover.update((a, b))
+            else:
+                cover.add(v)
+
+        return sorted(cover)
+
+    def take(self, v):
+        self.taken.append(v)
+        self.graph.remove(v)
+
+    def check_deadline(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise Timeout()
+
+    def reduce_low_degree(self, vertices):
+        """Applies the rules for vertices of degree at most two, starting
+        with `vertices`, until they no longer apply. Returns the number of
+        reductions and leaves the vertices they touched in `graph.touched`.
+        """
+        graph = self.graph
+        reductions = 0
+        touched = set()
+        pending = sorted(vertices, reverse=True)
+        while pending:
+            v = pending.pop()
+            if graph.removed[v] or graph.degree(v) > 2:
+                continue
+
+            graph.touched = set()
+            neighbors = list(graph.adjacencies[v])
+            if len(neighbors) == 0:
+                graph.remove(v)
+            elif len(neighbors) == 1:
+                self.take(neighbors[0])
+            else:
+                a, b = neighbors
+                if b in graph.adjacencies[a]:
+                    self.take(a)
+                    self.take(b)
+                else:
+                    outer = (graph.adjacencies[a] | graph.adjacencies[b]) - {v}
+                    for u in (v, a, b):
+                        graph.remove(u)
+                    folded = graph.add_vertex(outer)
+                    self.folds.append((v, a, b, folded))
+
+            reductions += 1
+            if not reductions % DEADLINE_INTERVAL:
+                self.check_deadline()
+            pending.extend(u for u in graph.touched if not graph.removed[u])
+            touched.update(graph.touched)
+
+        graph.touched = touched
+        return reductions
+
+    def reduce_lp(self):
+        """Takes the vertices with value 1 and removes those with value 0 in
+        an optimal solution of the LP relaxation (see `vertexcover.lp`).
+        Returns the number of removed vertices.
+        """
+        graph = self.graph
+        solution = lp_solution(graph.adjacencies)
+        reductions = 0
+        for v in graph.vertices():
+            if solution[v] == 2:
+                self.take(v)
+                reductions += 1
+        for v in graph.vertices():
+            if solution[v] == 0:
+                graph.remove(v)
+                reductions += 1
+
+        return reductions
+
+    def reduce_crown(self):
+        """Takes the head and removes the vertices of a crown, if there is
+        one. Returns the number of removed vertices.
+        """
+        crown = find_crown(self.graph)
+        if crown is None:
+            return 0
+
+        crown, head = crown
+        for v in sorted(head):
+            self.take(v)
+        for v in crown:
+            if not self.graph.removed[v]:
+                self.graph.remove(v)
+
+        return len(crown) + len(head)
+
+    def reduce(self, vertices):
+        graph = self.graph
+        pending = set(vertices)
+        while pending:
+            start = time.perf_counter()
+            self.check_deadline()
+            graph.touched = set()
+            low_degree = self.reduce_low_degree(pending)
+
+            # The low degree rules no longer apply to the vertices they
+            # touched, so only those touched by dominance are checked again.
+            pending.update(graph.touched)
+            graph.touched = set()
+            self.check_deadline()
+            cover, _ = reduce_dominance(graph, pending)
+            self.taken.extend(cover)
+            pending = {v for v in graph.touched if not graph.removed[v]}
+
+            # The LP relaxation and crowns concern the whole graph, so they
+            # are only used when the cheap rules no longer apply (and leave
+            # edges).
+            lp = crown = 0
+            if not pending and graph.edge_count:
+                graph.touched = set()
+                self.check_deadline()
+                lp = self.reduce_lp()
+                if not lp:
+                    self.check_deadline()
+                    crown = self.reduce_crown()
+                pending = {v for v in graph.touched if not graph.removed[v]}
+
+            self.rounds.append(
+                dict(
+                    low_degree=low_degree,
+                    dominance=len(cover),
+                    lp=lp,
+                    crown=crown,
+                    time=time.perf_counter() - start,
+                    vertices=graph.vertex_count,
+                    edges=graph.edge_count,
+                )
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="the edge list of the network")
+    parser.add_argument(
+        "--dominance-only",
+        action="store_true",
+        help="only apply the dominance rule instead of computing the kernel",
+    )
+    args = parser.parse_args()
+
+    graph = read_edge_list(args.path)
+    print("%d vertices, %d edges" % (graph.vertex_count, graph.edge_count))
+    if args.dominance_only:
+        cover, rounds = reduce_dominance(ReducibleGraph.from_graph(graph))
+        for i, data in enumerate(rounds):
+            print(
+                "round %d: %d reductions in %.2fs, %d vertices and %d edges left"
+                % (
+                    i + 1,
+                    data["reductions"],
+                    data["time"],
+                    data["vertices"],
+                    data["edges"],
+                )
+            )
+        print("%d vertices taken" % len(cover))
+        return
+
+    kernel = Kernel(ReducibleGraph.from_graph(graph))
+    for i, data in enumerate(kernel.rounds):
+        print(
+            "round %d: %d low degree, %d dominance, %d LP and %d crown"
+            " reductions in %.2fs, %d vertices and %d edges left"
+            % (
+                i + 1,
+                data["low_degree"],
+                data["dominance"],
+                data["lp"],
+                data["crown"],
+                data["time"],
+                data["vertices"],
+                data["edges"],
+            )
+        )
+    print(
+        "kernel: %d vertices, %d edges, %d vertices taken, %d folds"
+        % (
+            kernel.graph.vertex_count,
+            kernel.graph.edge_count,
+            len(kernel.taken),
+            len(kernel.folds),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
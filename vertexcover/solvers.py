@@ -0,0 +1,287 @@
+"""Vertex cover solvers for the graphs of `vertexcover.graph`.
+
+All solvers return the cover as a list of vertices.
+"""
+
+import concurrent.futures
+import time
+
+from vertexcover.lp import lp_lower_bound, lp_solution
+from vertexcover.reductions import Kernel, ReducibleGraph, Timeout
+
+# Components with at most this many vertices are solved exactly by the
+# improved greedy algorithm.
+SMALL_COMPONENT_SIZE = 10
+
+
+class DegreeQueue:
+    """A bucket priority queue of vertices by their degree in `degrees`, a
+    list that the caller updates. Degrees may only decrease, and a vertex
+    has to be pushed again when its degree does. Entries whose degree has
+    changed since they were pushed are skipped when popping, so all
+    operations take O(n + m) time in total.
+
+    Among vertices of maximum degree, the one pushed last is popped first.
+    Initially, this is the first vertex of `order` (by default, the one with
+    the smallest id).
+    """
+
+    def __init__(self, degrees, order=None):
+        self.degrees = degrees
+        self.buckets = [list() for _ in range(max(degrees, default=0) + 1)]
+        self.degree = len(self.buckets) - 1
+        order = range(len(degrees)) if order is None else order
+        for v in reversed(order):
+            self.push(v)
+
+    def push(self, v):
+        if self.degrees[v] > 0:
+            self.buckets[self.degrees[v]].append(v)
+
+    def pop(self):
+        """A vertex of maximum (positive) degree, or None if there is none."""
+        while self.degree > 0:
+            bucket = self.buckets[self.degree]
+            while bucket:
+                v = bucket.pop()
+                if self.degrees[v] == self.degree:
+                    return v
+            self.degree -= 1
+
+        return None
+
+
+def greedy_cover(graph, order=None):
+    """The standard greedy algorithm, which repeatedly takes a vertex of
+    maximum degree and removes it. The cover is in the order in which the
+    vertices are taken. Ties are broken deterministically, see
+    `DegreeQueue`.
+    """
+    adjacencies = graph.adjacencies()
+    degrees = [len(neighbors) for neighbors in adjacencies]
+    queue = DegreeQueue(degrees, order)
+
+    cover = list()
+    v = queue.pop()
+    while v is not None:
+        cover.append(v)
+        degrees[v] = 0
+        for u in adjacencies[v]:
+            if degrees[u] > 0:
+                degrees[u] -= 1
+                queue.push(u)
+        v = queue.pop()
+
+    return cover
+
+
+def covered_neighbors(graph, cover):
+    """For each vertex of `cover` (in its order), the neighbors whose edges
+    it covers first, i.e., that are not earlier in `cover`.
+    """
+    positions = {v: i for i, v in enumerate(cover)}
+    return [
+        [
+            u
+            for u in graph.neighbors_of(v).tolist()
+            if positions.get(u, len(cover)) > positions[v]
+        ]
+        for v in cover
+    ]
+
+
+def small_component(adjacencies, removed, start, small_size):
+    """The vertices of the component of `start` after deleting `removed`, or
+    None if it has more than `small_size` vertices.
+    """
+    component = [start]
+    seen = {start}
+    for v in component:
+        for u in adjacencies[v]:
+            if u not in seen and not removed[u]:
+                if len(component) == small_size:
+                    return None
+                seen.add(u)
+                component.append(u)
+
+    return component
+
+
+def improved_greedy_cover(graph, small_size=SMALL_COMPONENT_SIZE):
+    """The greedy algorithm of Bläsius, Friedrich and Katzmann (ESA 2021).
+    Like the standard greedy algorithm, it takes vertices of maximum degree,
+    but every component that becomes small (at most `small_size` vertices)
+    is solved exactly instead.
+    """
+    adjacencies = graph.adjacencies()
+    degrees = [len(neighbors) for neighbors in adjacencies]
+    removed = [False] * graph.vertex_count
+    cover = list()
+
+    def solve_if_small(start):
+        if removed[start]:
+            return
+        component = small_component(adjacencies, removed, start, small_size)
+        if component is None:
+            return
+
+        component_adjacencies = {
+            v: {u for u in adjacencies[v] if not removed[u]} for v in component
+        }
+        cover.extend(exact_cover_of(component_adjacencies))
+        for v in component:
+            removed[v] = True
+            degrees[v] = 0
+
+    for v in range(graph.vertex_count):
+        solve_if_small(v)
+
+    queue = DegreeQueue(degrees)
+    v = queue.pop()
+    while v is not None:
+        cover.append(v)
+        removed[v] = True
+        degrees[v] = 0
+        for u in adjacencies[v]:
+            if not removed[u]:
+                degrees[u] -= 1
+                queue.push(u)
+
+        # Only the components of the neighbors have changed.
+        for u in adjacencies[v]:
+            solve_if_small(u)
+        v = queue.pop()
+
+    return cover
+
+
+def exact_cover(graph, timeout=None, workers=1, upper_bound=None):
+    """A minimum vertex cover, computed by branch and reduce (see
+    `branch_and_reduce`), or None if it takes longer than `timeout` seconds.
+    The cover `upper_bound` (by default, the improved greedy cover) bounds
+    the search from above. With more than one worker, large components of
+    the kernel are solved in parallel processes.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    if upper_bound is None:
+        upper_bound = improved_greedy_cover(graph)
+    try:
+        if workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                cover = branch_and_reduce(
+                    ReducibleGraph.from_graph(graph),
+                    len(upper_bound),
+                    deadline,
+                    executor=executor,
+                )
+        else:
+            cover = branch_and_reduce(
+                ReducibleGraph.from_graph(graph), len(upper_bound), deadline
+            )
+    except (Timeout, RecursionError):
+        return None
+
+    # Without a smaller cover, the greedy cover is minimum.
+    return upper_bound if cover is None else cover
+
+
+def exact_cover_of(adjacencies, deadline=None):
+    """A minimum vertex cover of the graph given as a dictionary of
+    neighbor sets.
+    """
+    vertices = list(adjacencies)
+    indices = {v: i for i, v in enumerate(vertices)}
+    graph = ReducibleGraph([{indices[u] for u in adjacencies[v]} for v in vertices])
+    cover = branch_and_reduce(graph, float("inf"), deadline)
+    return [vertices[v] for v in cover]
+
+
+def lower_bound(graph):
+    """The lower bound of the LP relaxation (see `vertexcover.lp`) for the
+    `ReducibleGraph`.
+    """
+    return lp_lower_bound(lp_solution(graph.adjacencies))
+
+
+def solve_component(subgraph, vertices, upper_bound, deadline):
+    """The result of `branch_and_reduce` for the `subgraph` induced by
+    `vertices`, in terms of `vertices`.
+    """
+    cover = branch_and_reduce(subgraph, upper_bound, deadline)
+    return None if cover is None else [vertices[v] for v in cover]
+
+
+def branch_and_reduce(graph, upper_bound, deadline=None, vertices=None, executor=None):
+    """A minimum vertex cover of the `ReducibleGraph` with less than
+    `upper_bound` vertices, or None if there is none. The graph is reduced to
+    its kernel (see `Kernel`, reducing only around `vertices` if given), and
+    the search is pruned with the LP lower bound. Components of the
+    kernel are solved separately (in the processes of `executor`, if given),
+    otherwise a vertex of maximum degree is branched on: either it is in the
+    cover, or all of its neighbors are.
+    """
+    if deadline is not None and time.monotonic() > deadline:
+        raise Timeout()
+
+    kernel = Kernel(graph, vertices, deadline)
+    upper_bound -= kernel.offset
+    if graph.edge_count == 0:
+        return kernel.lift([]) if upper_bound > 0 else None
+
+    parts = list(graph.components())
+    subgraphs = [graph.subgraph(part) for part in parts]
+    bounds = [lower_bound(subgraph) for subgraph in subgraphs]
+    if sum(bounds) >= upper_bound:
+        return None
+
+    if len(parts) > 1:
+        # Each component can only take what the others leave at least.
+        if executor is not None:
+            futures = [
+                executor.submit(
+                    solve_component,
+                    subgraph,
+                    part,
+                    upper_bound - sum(bounds) + bound,
+                    deadline,
+                )
+                for subgraph, part, bound in zip(subgraphs, parts, bounds)
+            ]
+            covers = [future.result() for future in futures]
+            if None in covers or sum(map(len, covers)) >= upper_bound:
+                return None
+        else:
+            # The budget shrinks by what each solved component actually takes.
+            covers = list()
+            remaining = sum(bounds)
+            for subgraph, part, bound in zip(subgraphs, parts, bounds):
+                remaining -= bound
+                spent = sum(map(len, covers))
+                cover = solve_component(
+                    subgraph, part, upper_bound - spent - remaining, deadline
+                )
+                if cover is None:
+                    return None
+                covers.append(cover)
+
+        return kernel.lift([v for cover in covers for v in cover])
+
+    # The component is branched on as a compact subgraph, which keeps the
+    # copies small.
+    (part,) = parts
+    (subgraph,) = subgraphs
+    v = max(range(len(part)), key=subgraph.degree)
+    best = None
+    for taken in ([v], sorted(subgraph.adjacencies[v])):
+        branch = subgraph.copy()
+        for u in taken:
+            branch.remove(u)
+
+        cover = branch_and_reduce(
+            branch, upper_bound - len(taken), deadline, vertices=branch.touched
+        )
+        if cover is not None and len(taken) + len(cover) < upper_bound:
+            best = taken + cover
+            upper_bound = len(best)
+
+    return None if best is None else kernel.lift([part[u] for u in best])